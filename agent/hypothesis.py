@@ -10,10 +10,11 @@ logger = logging.getLogger(__name__)
 class HypothesisGenerator:
     """Generates novel research ideas from a list of paper summaries."""
 
-    def __init__(self, llm_provider: str = None):
+    def __init__(self, llm_provider: str = None, llm=None):
         # Use multi-LLM client for intelligent routing
         from .llm import MultiLLMClient
-        self.llm = MultiLLMClient()
+        # Callers running several agents can pass one shared client
+        self.llm = llm if llm is not None else MultiLLMClient()
 
     def generate_ideas_groq_only(self, papers: list[dict], max_ideas=5) -> list[dict]:
         """
@@ -4,6 +4,9 @@ import urllib.parse
 import arxiv
 import requests
 import os
+import threading
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from .llm import LLMClient
 from config import SERPER_API_KEY_ENV
@@ -12,6 +15,22 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# One pooled session per process so repeated web searches reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+
+@lru_cache(maxsize=4)
+def _arxiv_client(page_size: int) -> arxiv.Client:
+    """
+    Shared arXiv client whose page size matches the papers we keep.
+    
+    The default client requests and parses pages of 100 entries even when
+    only max_results of them are used.
+    """
+    return arxiv.Client(page_size=page_size)
+
+
 class LiteratureReviewer:
     """Fetches papers from arXiv and enriches them with LLM analysis.
     
@@ -21,10 +40,11 @@ class LiteratureReviewer:
     - techniques: (LLM inferred)
     """
 
-    def __init__(self, llm_provider: str = None):
+    def __init__(self, llm_provider: str = None, llm=None):
         # Use new multi-LLM client for intelligent routing
         from .llm import MultiLLMClient
-        self.llm = MultiLLMClient()
+        # Callers running several agents can pass one shared client
+        self.llm = llm if llm is not None else MultiLLMClient()
         self.serper_key = os.getenv(SERPER_API_KEY_ENV)
 
     def web_search(self, query: str, num_results: int = 5) -> list[dict]:
@@ -41,7 +61,7 @@ class LiteratureReviewer:
         }
 
         try:
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = _SESSION.post(url, headers=headers, data=payload, timeout=10)
             results = response.json().get("organic", [])
             
             web_papers = []
@@ -110,56 +130,62 @@ class LiteratureReviewer:
         Returns:
             List of paper dicts with multi-LLM enrichment
         """
-        from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
-        import signal
+        papers = self.fetch_arxiv(query, max_results=max_results, timeout=timeout)
+        return self.enrich_papers(papers)
+    
+    def fetch_arxiv(self, query, max_results=5, timeout=15):
+        """
+        Fetch raw paper metadata from arXiv (no LLM enrichment).
         
+        The fetch runs on a helper thread so the deadline holds on any thread;
+        after ``timeout`` seconds whatever papers arrived so far are returned.
+        """
         papers = []
+        errors = []
         
-        def timeout_handler(signum, frame):
-            raise TimeoutError("arXiv search timed out")
-        
-        try:
-            # Set alarm for timeout (Unix only, fallback for Windows)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(timeout)
-            
-            search = arxiv.Search(
-                query=query,
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.Relevance
-            )
-            
-            # Fetch papers with timeout protection
-            result_count = 0
-            for r in search.results():
-                if result_count >= max_results:
-                    break
-                    
-                encoded_title = urllib.parse.quote(r.title)
-                scholar_url = f"https://scholar.google.com/scholar?q={encoded_title}"
-                
-                papers.append({
-                    "title": r.title,
-                    "authors": [a.name for a in r.authors][:5],  # Keep more authors for quality
-                    "summary": r.summary[:800],  # Longer summaries for better analysis
-                    "pdf_url": r.pdf_url,
-                    "google_scholar_url": scholar_url,
-                    "objective": "Analyzing...",
-                    "techniques": ["Analyzing..."],
-                })
-                result_count += 1
-            
-            # Cancel alarm
-            if hasattr(signal, 'SIGALRM'):
-                signal.alarm(0)
+        def collect():
+            try:
+                search = arxiv.Search(
+                    query=query,
+                    max_results=max_results,
+                    sort_by=arxiv.SortCriterion.Relevance
+                )
                 
-        except TimeoutError:
+                # Results are parsed one at a time from a page sized to what we keep
+                for r in _arxiv_client(max_results).results(search):
+                    if len(papers) >= max_results:
+                        break
+                    
+                    encoded_title = urllib.parse.quote(r.title)
+                    scholar_url = f"https://scholar.google.com/scholar?q={encoded_title}"
+                    
+                    papers.append({
+                        "title": r.title,
+                        "authors": [a.name for a in r.authors][:5],  # Keep more authors for quality
+                        "summary": r.summary[:800],  # Longer summaries for better analysis
+                        "pdf_url": r.pdf_url,
+                        "google_scholar_url": scholar_url,
+                        "objective": "Analyzing...",
+                        "techniques": ["Analyzing..."],
+                    })
+            except Exception as e:
+                errors.append(e)
+        
+        # Daemon, so a stalled request can't block process exit
+        worker = threading.Thread(target=collect, name="arxiv-fetch", daemon=True)
+        worker.start()
+        worker.join(timeout)
+        
+        if worker.is_alive():
             logger.warning(f"arXiv search timed out after {timeout}s, returning {len(papers)} papers")
-        except Exception as e:
-            logger.error(f"arXiv search failed: {e}")
+            return list(papers)
+        if errors:
+            logger.error(f"arXiv search failed: {errors[0]}")
             return []
-        
+        return papers
+    
+    def enrich_papers(self, papers):
+        """Fill objective/method/tools/results for each paper in place and return them."""
         # Multi-LLM parallel enrichment with intelligent routing
         if self.llm.available and papers:
             logger.info(f"Enriching {len(papers)} papers with multi-LLM system")
@@ -14,9 +14,11 @@ Features:
 """
 import os
 import logging
+import threading
 from typing import Optional, Literal
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait, TimeoutError as FutureTimeoutError
 import time
+from functools import lru_cache
 
 from config import (
     GEMINI_MODEL, 
@@ -30,6 +32,27 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fast-generation provider may run before the next one is started too;
+# 0 disables hedging (the next provider only starts after a failure)
+HEDGE_DELAY = float(os.getenv("LLM_HEDGE_DELAY", "4.0"))
+
+# Set inside hedged provider calls; see hedge_lost()
+_hedge_state = threading.local()
+
+
+def _run_hedged(settled: threading.Event, call, *args):
+    _hedge_state.settled = settled
+    try:
+        return call(*args)
+    finally:
+        _hedge_state.settled = None
+
+
+def hedge_lost() -> bool:
+    """True inside a hedged provider call whose fan-out has already returned."""
+    settled = getattr(_hedge_state, "settled", None)
+    return settled is not None and settled.is_set()
+
 try:
     from groq import Groq
     HAS_GROQ = True
@@ -52,6 +75,21 @@ except ImportError:
     logger.warning("Gemini library not installed")
 
 
+@lru_cache(maxsize=None)
+def _shared_http_client():
+    """
+    One keep-alive connection pool for every Groq/Oxlo client in the process.
+    
+    Both SDKs are built on httpx (installed with them), so clients created per
+    run or per task reuse open TLS connections instead of handshaking again.
+    """
+    import httpx
+    return httpx.Client(
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=8, keepalive_expiry=60.0),
+    )
+
+
 class MultiLLMClient:
     """
     Intelligent multi-LLM orchestrator with automatic routing and fallback.
@@ -62,6 +100,8 @@ class MultiLLMClient:
     - IDEAS tasks → Oxlo (fallback: Groq)
     """
     
+    hedge_delay = HEDGE_DELAY
+    
     def __init__(self):
         self.groq_client = None
         self.gemini_client = None
@@ -91,7 +131,7 @@ class MultiLLMClient:
         groq_key = os.getenv(GROQ_API_KEY_ENV)
         if HAS_GROQ and groq_key:
             try:
-                self.groq_client = Groq(api_key=groq_key)
+                self.groq_client = Groq(api_key=groq_key, http_client=_shared_http_client())
                 self.groq_available = True
                 logger.info(f"Groq initialized: {GROQ_MODEL}")
             except Exception as e:
@@ -113,7 +153,7 @@ class MultiLLMClient:
         oxlo_key = os.getenv(OXLO_API_KEY_ENV)
         if HAS_OPENAI and oxlo_key:
             try:
-                self.oxlo_client = OpenAI(api_key=oxlo_key, base_url=OXLO_BASE_URL)
+                self.oxlo_client = OpenAI(api_key=oxlo_key, base_url=OXLO_BASE_URL, http_client=_shared_http_client())
                 self.oxlo_available = True
                 logger.info(f"Oxlo initialized: {OXLO_MODEL}")
             except Exception as e:
@@ -133,54 +173,76 @@ class MultiLLMClient:
         """
         Fast generation for summaries and quick tasks.
         
-        Routing: Groq (primary) → Oxlo (fallback)
+        Routing: Groq (primary) → Oxlo → Gemini, hedged: the next provider
+        starts as soon as the previous one fails or has been running for
+        ``hedge_delay`` seconds, and the first non-empty response wins.
         Use case: Paper summarization, quick extraction
         """
-        # Try Groq first (fastest)
+        providers = []
         if self.groq_available:
-            try:
-                response = self._call_groq(prompt, max_tokens, timeout)
-                if response and response.strip():
-                    return response
-                else:
-                    logger.warning("[LLM] Groq returned empty, retrying once...")
-                    # Retry once on empty response
-                    try:
-                        response = self._call_groq(prompt, max_tokens, timeout)
-                        if response and response.strip():
-                            logger.info("[LLM] Groq retry successful")
-                            return response
-                    except Exception as retry_e:
-                        logger.warning(f"[LLM] Groq retry failed: {retry_e}")
-                    
-                    logger.info("[LLM] Fallback → Oxlo (Groq empty response)")
-            except Exception as e:
-                logger.warning(f"[LLM] Groq failed, falling back to Oxlo: {e}")
-        
-        # Fallback to Oxlo
+            providers.append(("Groq", self._call_groq))
         if self.oxlo_available:
-            try:
-                logger.info("[LLM] Using Oxlo fallback for fast generation")
-                response = self._call_oxlo(prompt, max_tokens, timeout)
-                if response and response.strip():
-                    logger.info("[LLM] Oxlo fallback success")
-                    return response
-            except Exception as e:
-                logger.warning(f"[LLM] Oxlo fallback failed: {e}")
-        
-        # Last resort: Gemini
+            providers.append(("Oxlo", self._call_oxlo))
         if self.gemini_available:
-            try:
-                logger.info("[LLM] Using Gemini as last resort for fast generation")
-                response = self._call_gemini(prompt, max_tokens, timeout)
-                if response and response.strip():
-                    logger.info("[LLM] Gemini last resort success")
-                    return response
-            except Exception as e:
-                logger.warning(f"[LLM] Gemini last resort failed: {e}")
+            providers.append(("Gemini", self._call_gemini))
         
-        logger.error("[LLM] All fast generation providers failed")
-        return ""
+        response = self._first_success(providers, prompt, max_tokens, timeout)
+        if not response:
+            logger.error("[LLM] All fast generation providers failed")
+        return response
+    
+    def _first_success(self, providers: list, prompt: str, max_tokens: int, timeout: int) -> str:
+        """Run provider calls as a hedged fan-out and return the first non-empty response."""
+        if not providers:
+            return ""
+        
+        executor = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="llm-hedge")
+        # Set once a winner is returned, so late calls know they lost
+        settled = threading.Event()
+        pending = {}
+        next_index = 0
+        hedge_delay = self.hedge_delay
+        if hedge_delay > 0:
+            deadline = time.monotonic() + timeout + hedge_delay * (len(providers) - 1)
+        else:
+            # Plain fallback: each provider in turn gets the full timeout
+            hedge_delay = float("inf")
+            deadline = time.monotonic() + timeout * len(providers)
+        try:
+            while True:
+                if next_index < len(providers) and (not pending or time.monotonic() >= hedge_at):
+                    name, call = providers[next_index]
+                    if next_index:
+                        logger.info(f"[LLM] Hedging fast generation with {name}")
+                    pending[executor.submit(_run_hedged, settled, call, prompt, max_tokens, timeout)] = name
+                    next_index += 1
+                    hedge_at = time.monotonic() + hedge_delay
+                
+                remaining = deadline - time.monotonic()
+                if not pending or remaining <= 0:
+                    return ""
+                wait_for = remaining
+                if next_index < len(providers):
+                    wait_for = max(0.0, min(remaining, hedge_at - time.monotonic()))
+                
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        response = future.result()
+                        if response and response.strip():
+                            if next_index > 1:
+                                logger.info(f"[LLM] {name} answered first")
+                            return response
+                        logger.warning(f"[LLM] {name} returned empty response")
+                    except Exception as e:
+                        logger.warning(f"[LLM] {name} fast generation failed: {e}")
+                    # Move on immediately rather than waiting out the hedge delay
+                    hedge_at = time.monotonic()
+        finally:
+            # Slower calls can't be interrupted; let them finish in the background
+            settled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def generate_deep(
         self, 
@@ -1,16 +1,12 @@
 import json
 import logging
+from importlib.util import find_spec
 from pathlib import Path
 from utils import now_iso, save_text, save_json
 
-try:
-    from docx import Document
-    from docx.shared import Pt, Inches
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.table import WD_ALIGN_VERTICAL
-    HAS_DOCX = True
-except ImportError:
-    HAS_DOCX = False
+# python-docx (and lxml) is only imported when a DOCX is actually written, so
+# the lightweight backend report path never pays for it in memory
+HAS_DOCX = find_spec("docx") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +151,10 @@ class ReportGenerator:
 
     def _save_docx(self, path, query, papers, new_ideas, sections, ts):
         """Generates a beautified Docx file with tables."""
+        from docx import Document
+        from docx.shared import Pt
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        
         doc = Document()
         
         # Title
@@ -2,6 +2,8 @@ import logging
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from .llm import MultiLLMClient
 from .lit_review import LiteratureReviewer
 from .hypothesis import HypothesisGenerator
 from .experiment import ExperimentDesigner, ExperimentEvaluator
@@ -19,8 +21,10 @@ class AgentRunner:
         if not os.path.exists(self.out_dir):
             os.makedirs(self.out_dir)
             
-        self.reviewer = LiteratureReviewer(llm_provider=llm_provider)
-        self.hypo = HypothesisGenerator(llm_provider=llm_provider)
+        # One LLM client (and its provider SDK connection pools) shared by both agents
+        llm = MultiLLMClient()
+        self.reviewer = LiteratureReviewer(llm_provider=llm_provider, llm=llm)
+        self.hypo = HypothesisGenerator(llm_provider=llm_provider, llm=llm)
         self.designer = ExperimentDesigner()
         self.evaluator = ExperimentEvaluator()
         self.reporter = ReportGenerator(out_dir=self.out_dir)
@@ -59,27 +63,31 @@ class AgentRunner:
 
             # Enrich web results if needed (already mostly structured)
             if mode == "Web Search" and self.reviewer.llm.available and papers:
-                from concurrent.futures import ThreadPoolExecutor
                 with ThreadPoolExecutor(max_workers=len(papers)) as executor:
                     executor.map(self.reviewer._enrich_paper, papers)
             
             self._save_checkpoint("step_1_papers", papers)
 
-            # 2. Idea Generation
-            new_ideas = self._run_idea_generation(papers, live)
-            self._save_checkpoint("step_2_new_ideas", new_ideas)
+            # The report narrative only needs the papers, so it is generated in the
+            # background while ideas -> experiment -> evaluation run here
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                narrative = self._start_narrative_generation(executor, query, papers)
 
-            # 3. Experiment Design
-            first_idea_desc = new_ideas[0].get("description", "") if isinstance(new_ideas, list) and new_ideas else "No idea generated"
-            experiment = self._run_experiment_design(first_idea_desc, live)
-            self._save_checkpoint("step_3_experiment", experiment)
+                # 2. Idea Generation
+                new_ideas = self._run_idea_generation(papers, live)
+                self._save_checkpoint("step_2_new_ideas", new_ideas)
 
-            # 4. Evaluation
-            results = self._run_evaluation(experiment, live)
-            self._save_checkpoint("step_4_results", results)
+                # 3. Experiment Design
+                first_idea_desc = new_ideas[0].get("description", "") if isinstance(new_ideas, list) and new_ideas else "No idea generated"
+                experiment = self._run_experiment_design(first_idea_desc, live)
+                self._save_checkpoint("step_3_experiment", experiment)
 
-            # 4.5 Generate Report Narrative
-            report_sections = self._run_narrative_generation(query, papers, live)
+                # 4. Evaluation
+                results = self._run_evaluation(experiment, live)
+                self._save_checkpoint("step_4_results", results)
+
+                # 4.5 Report Narrative
+                report_sections = narrative.result()
             self._save_checkpoint("step_4_5_narrative", report_sections)
 
             # 5. Report Generation
@@ -136,9 +144,10 @@ class AgentRunner:
         self.notify("Evaluating (Simulation)...")
         return self.evaluator.evaluate(experiment)
 
-    def _run_narrative_generation(self, query, papers, live):
-        self.notify("Synthesizing Introduction, Issue, and Conclusion...")
-        return self.hypo.generate_report_sections(query, papers)
+    def _start_narrative_generation(self, executor, query, papers):
+        # Notify from the calling thread; UI callbacks (Streamlit) can't run on workers
+        self.notify("Synthesizing Introduction, Issue, and Conclusion in the background...")
+        return executor.submit(self.hypo.generate_report_sections, query, papers)
 
     def _run_report(self, query, papers, new_ideas, report_sections, experiment, results):
         self.notify("Generating report (saved to output)...")
@@ -7,13 +7,14 @@ Redirects logic to the high-fidelity frontend components.
 import streamlit as st
 import os
 import sys
+import json
 import time
 
 # CRITICAL: Add the frontend directory to sys.path so it works exactly like local
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend"))
 
 # Now we can import the premium components
-from frontend.api_client import ScholarPulseAPI, APIException
+from frontend.api_client import ScholarPulseAPI, APIException, APIError
 from frontend.components.feedback import (
     get_feedback_styles,
     render_success_card,
@@ -24,7 +25,8 @@ from frontend.components.feedback import (
     render_empty_state,
     _sanitize
 )
-from frontend.components.cards import render_papers_grid, render_ideas_list, render_paper_card, render_idea_card
+from frontend.components.cards import DEMO_PAPERS, render_papers_grid, render_ideas_list
+from frontend.components.layout import render_top_navbar, render_sidebar_branding
 from frontend.styles.theme import get_theme_css, get_color_scheme
 
 # Import everything else from frontend/app.py or just replicate the logic
@@ -38,10 +40,12 @@ st.set_page_config(
     layout="wide",
 )
 
-# Initialize API client
-api = ScholarPulseAPI()
+# Initialize API client (one per process, so its requests.Session pool survives reruns)
+@st.cache_resource
+def get_api_client() -> ScholarPulseAPI:
+    return ScholarPulseAPI()
 
-import json
+api = get_api_client()
 
 # Settings Persistence Helpers
 SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "user_settings.json")
@@ -61,7 +65,7 @@ def load_settings():
             with open(SETTINGS_FILE, "r") as f:
                 stored = json.load(f)
                 defaults.update(stored)
-        except:
+        except (OSError, ValueError):
             pass
     return defaults
 
@@ -78,44 +82,37 @@ def save_settings():
     try:
         with open(SETTINGS_FILE, "w") as f:
             json.dump(settings, f)
-    except:
+    except OSError:
         pass
 
-# Initialize settings from file
-persisted_settings = load_settings()
+def on_theme_change():
+    """Apply the picked theme before the rerun the radio already triggers, so no extra st.rerun() is needed."""
+    st.session_state.theme = st.session_state.theme_select
+    save_settings()
 
-# Session State Initialization
+# Initialize settings from file (only on a session's first run)
 if 'theme' not in st.session_state:
-    st.session_state.theme = persisted_settings["theme"]
-if 'researcher_name' not in st.session_state:
-    st.session_state.researcher_name = persisted_settings["researcher_name"]
-if 'llm_provider' not in st.session_state:
-    st.session_state.llm_provider = persisted_settings["llm_provider"]
-if 'search_depth' not in st.session_state:
-    st.session_state.search_depth = persisted_settings["search_depth"]
-if 'concurrency' not in st.session_state:
-    st.session_state.concurrency = persisted_settings["concurrency"]
-if 'tone' not in st.session_state:
-    st.session_state.tone = persisted_settings["tone"]
-
-if 'page' not in st.session_state:
-    st.session_state.page = "Dashboard"
-if 'is_researching' not in st.session_state:
-    st.session_state.is_researching = False
-if 'papers_found' not in st.session_state:
-    st.session_state.papers_found = 0
-if 'searches_made' not in st.session_state:
-    st.session_state.searches_made = 0
-if 'reports_generated' not in st.session_state:
-    st.session_state.reports_generated = 0
-if 'session_start' not in st.session_state:
-    st.session_state.session_start = time.time()
-if 'backend_healthy' not in st.session_state:
-    st.session_state.backend_healthy = False
-if 'selected_task_id' not in st.session_state:
-    st.session_state.selected_task_id = None
-if 'settings_tab' not in st.session_state:
-    st.session_state.settings_tab = "General"
+    persisted_settings = load_settings()
+    for key in ("theme", "researcher_name", "llm_provider", "search_depth", "concurrency", "tone"):
+        st.session_state.setdefault(key, persisted_settings[key])
+
+# Session State Initialization
+for key, value in (
+    ('page', "Dashboard"),
+    ('is_researching', False),
+    ('papers_found', 0),
+    ('searches_made', 0),
+    ('reports_generated', 0),
+    ('session_start', time.monotonic()),
+    ('backend_healthy', False),
+    ('selected_task_id', None),
+    ('settings_tab', "General"),
+    # Sidebar research options, kept outside widget state (see render_research_config)
+    ('research_provider', "Groq"),
+    ('research_mode', "Deep Research"),
+    ('research_year', 2024),
+):
+    st.session_state.setdefault(key, value)
 
 def sync_kpis():
     """Fetch live stats from backend and update session state."""
@@ -125,7 +122,7 @@ def sync_kpis():
             st.session_state.papers_found = stats.get('total_papers', 0)
             st.session_state.searches_made = stats.get('total_searches', 0)
             st.session_state.reports_generated = stats.get('total_reports', 0)
-        except:
+        except (APIException, ValueError):
             pass
 
 # Check backend health periodically
@@ -133,12 +130,12 @@ try:
     st.session_state.backend_healthy = api.health_check()
     if st.session_state.backend_healthy:
         sync_kpis()
-except:
+except APIException:
     st.session_state.backend_healthy = False
 
 # Apply Premium Theme CSS
-st.markdown(get_theme_css(st.session_state.theme), unsafe_allow_html=True)
-st.markdown(get_feedback_styles(st.session_state.theme), unsafe_allow_html=True)
+# One element for both stylesheets; the blank line keeps them separate HTML blocks for the markdown parser
+st.markdown(get_theme_css(st.session_state.theme) + "\n\n" + get_feedback_styles(st.session_state.theme), unsafe_allow_html=True)
 colors = get_color_scheme(st.session_state.theme)
 
 # Helper for sidebar navigation
@@ -147,19 +144,34 @@ def nav_page(page_name):
     st.session_state.selected_task_id = None
     st.rerun()
 
+RESEARCH_OPTION_KEYS = (
+    ("provider", "research_provider"),
+    ("mode_val", "research_mode"),
+    ("year_val", "research_year"),
+)
+
+def store_research_option(widget_key, store_key):
+    st.session_state[store_key] = st.session_state[widget_key]
+
+@st.fragment
+def render_research_config():
+    """Sidebar research options. As a fragment, changing one reruns only this block."""
+    st.markdown(f"<p style='font-weight: 600; color: {colors['text']}; margin: 0 16px 12px 0px; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.7;'>🛠️ Configuration</p>", unsafe_allow_html=True)
+    # Streamlit drops a keyed widget's state on pages that don't render it, so
+    # each pick is copied to a plain research_* key and restored from there
+    for widget_key, store_key in RESEARCH_OPTION_KEYS:
+        if widget_key not in st.session_state:
+            st.session_state[widget_key] = st.session_state[store_key]
+    st.selectbox("Intelligence", ["Groq", "Oxlo", "Gemini"], key="provider",
+                 on_change=store_research_option, args=("provider", "research_provider"))
+    st.selectbox("Research Mode", ["Deep Research", "Web Search", "Study & Learn"], key="mode_val",
+                 on_change=store_research_option, args=("mode_val", "research_mode"))
+    st.number_input("Year Filter", min_value=0, max_value=2030, key="year_val",
+                    on_change=store_research_option, args=("year_val", "research_year"))
+
 # --- SIDEBAR IMPLEMENTATION ---
 with st.sidebar:
-    branding_html = f"""
-<div class="sidebar-logo-container">
-<div style="width: 56px; height: 56px; border-radius: 16px; background: linear-gradient(135deg, #6366F1, #8B5CF6); display: flex; align-items: center; justify-content: center; font-size: 1.6rem; box-shadow: 0 8px 16px rgba(99, 102, 241, 0.3);">🧠</div>
-<div style="text-align: center;">
-<div style="font-weight: 700; font-size: 1.2rem; color: {colors['text']}; letter-spacing: -0.5px;">ScholarPulse</div>
-<div style="font-size: 0.75rem; color: {colors['muted']}; font-weight: 500; text-transform: uppercase; letter-spacing: 1px;">AI Research Agent</div>
-</div>
-</div>
-"""
-    st.markdown(branding_html, unsafe_allow_html=True)
-    st.markdown("<br>", unsafe_allow_html=True)
+    render_sidebar_branding(st.session_state.theme)
     
     # Navigation
     if st.button("📂 Dashboard", key="nav_dash", use_container_width=True, type="secondary" if st.session_state.page != "Dashboard" else "primary"):
@@ -172,90 +184,76 @@ with st.sidebar:
     st.markdown("<div class='stDivider'></div>", unsafe_allow_html=True)
     
     if st.session_state.page == "Dashboard":
-        st.markdown(f"<p style='font-weight: 600; color: {colors['text']}; margin: 0 16px 12px 0px; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 1px; opacity: 0.7;'>🛠️ Configuration</p>", unsafe_allow_html=True)
-        provider = st.selectbox("Intelligence", ["Groq", "Oxlo", "Gemini"], index=0)
-        mode_val = st.selectbox("Research Mode", ["Deep Research", "Web Search", "Study & Learn"], index=0)
-        year_val = st.number_input("Year Filter", min_value=0, max_value=2030, value=2024)
+        render_research_config()
     else:
         st.markdown(f"<p style='font-size: 0.85rem; color: {colors['muted']}; opacity: 0.6;'>Navigating to {st.session_state.page}...</p>", unsafe_allow_html=True)
 
     # Session Info at the bottom
-    st.sidebar.markdown("<div style='position: fixed; bottom: 20px; width: 260px;'>", unsafe_allow_html=True)
-    st.sidebar.markdown(f"<p style='font-size: 0.7rem; color: {colors['muted']}; text-align: center;'>Status: {('Online' if st.session_state.backend_healthy else 'Offline')}</p>", unsafe_allow_html=True)
-    st.sidebar.markdown("</div>", unsafe_allow_html=True)
+    st.sidebar.markdown(f"<div style='position: fixed; bottom: 20px; width: 260px;'><p style='font-size: 0.7rem; color: {colors['muted']}; text-align: center;'>Status: {('Online' if st.session_state.backend_healthy else 'Offline')}</p></div>", unsafe_allow_html=True)
 
 # --- PAGE ROUTING ---
 
+_KPI_CARD_TMPL = """
+<div class="premium-card">
+<div style="font-size: 1.4rem;">{icon}</div>
+<div style="font-size: 0.72rem; color: {muted}; text-transform: uppercase; font-weight: 700; margin-top: 8px;">{label}</div>
+<div style="font-size: 1.6rem; font-weight: 700;">{value}</div>
+</div>"""
+
+@st.fragment(run_every="1s")
+def render_uptime_card():
+    """Uptime card as a fragment: the once-a-second tick reruns only this card."""
+    elapsed_sec = int(time.monotonic() - st.session_state.session_start)
+    uptime_str = f"{elapsed_sec // 60}m {elapsed_sec % 60}s"
+    st.markdown(_KPI_CARD_TMPL.format(icon="⏱️", label="Uptime", value=uptime_str, muted=colors['muted']), unsafe_allow_html=True)
+
+def render_kpi_row():
+    counters_col, uptime_col = st.columns([3, 1], gap="small")
+    with counters_col:
+        kpi_cards = "".join(
+            _KPI_CARD_TMPL.format(icon=icon, label=label, value=f"{value:,}", muted=colors['muted'])
+            for icon, label, value in (
+                ("📄", "Papers Found", st.session_state.papers_found),
+                ("🔍", "Searches", st.session_state.searches_made),
+                ("📊", "Reports", st.session_state.reports_generated),
+            )
+        )
+        st.markdown(f'<div style="display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 1rem;">{kpi_cards}</div>', unsafe_allow_html=True)
+    with uptime_col:
+        render_uptime_card()
+
 def render_dashboard():
     # Modern Navbar
-    status_class = "" if st.session_state.backend_healthy else "offline"
-    status_text = "Connected" if st.session_state.backend_healthy else "Disconnected"
-    
-    navbar_html = f"""
-<div class="top-navbar">
-<a class="top-navbar-brand gradient-text" href="#" style="font-size: 1.3rem;">ScholarPulse</a>
-<div class="navbar-status">
-<div class="status-dot {status_class}"></div>
-<span style="font-weight: 500;">Backend: {status_text}</span>
-</div>
-</div>
-"""
-    st.markdown(navbar_html, unsafe_allow_html=True)
+    render_top_navbar(st.session_state.backend_healthy)
     
     # Wrapper for main content
     st.markdown("<div class='content-section'>", unsafe_allow_html=True)
     
     # Welcome Header
-    st.markdown(f"<h1 style='margin-bottom: 8px; font-weight: 800; font-size: 2.4rem; color: {colors['text']};'>Welcome back</h1>", unsafe_allow_html=True)
-    st.markdown(f"<p style='color: {colors['muted']}; margin-bottom: 36px; font-size: 1.15rem; font-weight: 400;'>How can I accelerate your research today?</p>", unsafe_allow_html=True)
+    st.markdown(
+        f"<h1 style='margin-bottom: 8px; font-weight: 800; font-size: 2.4rem; color: {colors['text']};'>Welcome back</h1>"
+        f"<p style='color: {colors['muted']}; margin-bottom: 36px; font-size: 1.15rem; font-weight: 400;'>How can I accelerate your research today?</p>",
+        unsafe_allow_html=True
+    )
 
     # KPI Row
-    elapsed_sec = int(time.time() - st.session_state.session_start)
-    uptime_str = f"{elapsed_sec // 60}m {elapsed_sec % 60}s"
-    
-    kpi1, kpi2, kpi3, kpi4 = st.columns(4)
-    with kpi1:
-        st.markdown(f"""
-<div class="premium-card">
-<div style="font-size: 1.4rem;">📄</div>
-<div style="font-size: 0.72rem; color: {colors['muted']}; text-transform: uppercase; font-weight: 700; margin-top: 8px;">Papers Found</div>
-<div style="font-size: 1.6rem; font-weight: 700;">{st.session_state.papers_found}</div>
-</div>""", unsafe_allow_html=True)
-    with kpi2:
-        st.markdown(f"""
-<div class="premium-card">
-<div style="font-size: 1.4rem;">🔍</div>
-<div style="font-size: 0.72rem; color: {colors['muted']}; text-transform: uppercase; font-weight: 700; margin-top: 8px;">Searches</div>
-<div style="font-size: 1.6rem; font-weight: 700;">{st.session_state.searches_made}</div>
-</div>""", unsafe_allow_html=True)
-    with kpi3:
-        st.markdown(f"""
-<div class="premium-card">
-<div style="font-size: 1.4rem;">📊</div>
-<div style="font-size: 0.72rem; color: {colors['muted']}; text-transform: uppercase; font-weight: 700; margin-top: 8px;">Reports</div>
-<div style="font-size: 1.6rem; font-weight: 700;">{st.session_state.reports_generated}</div>
-</div>""", unsafe_allow_html=True)
-    with kpi4:
-        st.markdown(f"""
-<div class="premium-card">
-<div style="font-size: 1.4rem;">⏱️</div>
-<div style="font-size: 0.72rem; color: {colors['muted']}; text-transform: uppercase; font-weight: 700; margin-top: 8px;">Uptime</div>
-<div style="font-size: 1.6rem; font-weight: 700;">{uptime_str}</div>
-</div>""", unsafe_allow_html=True)
+    render_kpi_row()
 
     # Search Area
     st.markdown("<div style='margin-top: 40px;'></div>", unsafe_allow_html=True)
-    query = st.text_input("QUERY_INPUT", placeholder="Describe your research topic or ask a technical question...", label_visibility="collapsed")
-    
-    col_u1, col_u2 = st.columns([3, 1])
-    with col_u1:
-        if st.session_state.is_researching:
-            go_button = st.button("✨ MISSION IN PROGRESS...", use_container_width=True, disabled=True)
-        else:
-            go_button = st.button("✨ START RESEARCH", use_container_width=True, disabled=not st.session_state.backend_healthy)
-    
-    with col_u2:
-        st.file_uploader("PDF_UPLOAD", type=["pdf"], label_visibility="collapsed")
+    # Inside a form, typing and uploading do not rerun the script until submit
+    with st.form("research_form", clear_on_submit=False, border=False):
+        query = st.text_input("QUERY_INPUT", placeholder="Describe your research topic or ask a technical question...", label_visibility="collapsed")
+        
+        col_u1, col_u2 = st.columns([3, 1])
+        with col_u1:
+            if st.session_state.is_researching:
+                go_button = st.form_submit_button("✨ MISSION IN PROGRESS...", use_container_width=True, disabled=True)
+            else:
+                go_button = st.form_submit_button("✨ START RESEARCH", use_container_width=True, disabled=not st.session_state.backend_healthy)
+        
+        with col_u2:
+            st.file_uploader("PDF_UPLOAD", type=["pdf"], label_visibility="collapsed")
 
     if (go_button and query) or st.session_state.is_researching:
         if go_button and query:
@@ -271,15 +269,23 @@ def render_dashboard():
             
             task_id = api.submit_research(
                 query=query,
-                mode=st.session_state.get('mode_val', 'Deep Research'),
-                year_filter=st.session_state.get('year_val', 2024),
-                llm_provider=st.session_state.get('provider', 'Groq').lower()
+                mode=st.session_state.research_mode,
+                year_filter=st.session_state.research_year,
+                llm_provider=st.session_state.research_provider.lower()
             )
             
-            result = api.poll_until_complete(
-                task_id=task_id,
-                on_progress=lambda p, s: progress_container.empty() or render_progress_card(p, s, st.session_state.theme)
-            )
+            last_reported = None
+
+            def on_progress(progress, step):
+                # Repaint the single placeholder only when the backend actually advanced
+                nonlocal last_reported
+                if (progress, step) == last_reported:
+                    return
+                last_reported = (progress, step)
+                with progress_container:
+                    render_progress_card(progress, step, st.session_state.theme)
+
+            result = api.poll_until_complete(task_id=task_id, on_progress=on_progress)
             
             progress_container.empty()
             with result_container:
@@ -302,18 +308,26 @@ def render_dashboard():
         render_empty_state("🚀", "Ready for Discovery?", "Enter a research query above to start your deep discovery mission.")
         
         st.markdown("<h3 class='gradient-text' style='margin: 40px 0 20px 0;'>🛡️ Featured Insights</h3>", unsafe_allow_html=True)
-        demo_papers = [
-            {"title": "Multi-Agent Systems for Scientific Discovery", "summary": "How LLM agents collaborate...", "authors": ["S. Kumar", "A. Patel"], "method": "Agentic Framework", "objective": "Automate discovery"},
-            {"title": "Neural Architecture Search via Evolution", "summary": "Optimizing models through...", "authors": ["R. Chen"], "method": "Evolutionary", "objective": "SOTA Performance"}
-        ]
-        render_papers_grid(demo_papers, st.session_state.theme)
+        render_papers_grid(DEMO_PAPERS, st.session_state.theme)
     
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def fetch_completed_result(task_id: str) -> dict:
+    """Fetch a finished task's results; completed results never change, so they are cached."""
+    result = api.get_result(task_id)
+    if 'papers' not in result:
+        # Still pending/running: raise so this response is not cached
+        raise APIException(APIError(code='TASK_NOT_READY', message=result.get('message', 'Task is not complete yet')))
+    return result
+
 def render_library_page():
-    st.markdown("<h1 class='gradient-text'>📑 My Research Library</h1>", unsafe_allow_html=True)
-    st.markdown("<p style='opacity: 0.7;'>Access all your past research missions and generated intelligence.</p>", unsafe_allow_html=True)
+    st.markdown(
+        "<h1 class='gradient-text'>📑 My Research Library</h1>"
+        "<p style='opacity: 0.7;'>Access all your past research missions and generated intelligence.</p>",
+        unsafe_allow_html=True
+    )
     
     try:
         tasks = api.list_tasks()
@@ -341,7 +355,7 @@ def render_library_page():
         if st.session_state.selected_task_id:
             st.markdown("<div class='stDivider'></div>", unsafe_allow_html=True)
             st.markdown(f"## Mission Results: {st.session_state.selected_task_id}")
-            result = api.get_result(st.session_state.selected_task_id)
+            result = fetch_completed_result(st.session_state.selected_task_id)
             render_papers_grid(result.get('papers', []), st.session_state.theme)
             render_ideas_list(result.get('ideas', []), st.session_state.theme)
             
@@ -349,21 +363,25 @@ def render_library_page():
         render_error_card("Library Load Error", str(e))
 
 
-def render_settings_section_header(title, description):
-    st.markdown(f"""
+_SECTION_HDR_TMPL = """
 <div class="settings-header">{title}</div>
-<p style="color: {colors['muted']}; margin-top: -16px; margin-bottom: 32px; font-size: 0.95rem;">{description}</p>
-""", unsafe_allow_html=True)
+<p style="color: {muted}; margin-top: -16px; margin-bottom: 32px; font-size: 0.95rem;">{desc}</p>
+"""
 
-def render_settings_row(label, description, widget_key=None):
-    col1, col2 = st.columns([2, 1])
-    with col1:
-        st.markdown(f"""
+_SETTINGS_ROW_TMPL = """
 <div class="settings-label-group">
     <div class="settings-label">{label}</div>
-    <div class="settings-description">{description}</div>
+    <div class="settings-description">{desc}</div>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+def render_settings_section_header(title, description):
+    st.markdown(_SECTION_HDR_TMPL.format(title=title, muted=colors['muted'], desc=description), unsafe_allow_html=True)
+
+def render_settings_row(label, description, widget_key=None):
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.markdown(_SETTINGS_ROW_TMPL.format(label=label, desc=description), unsafe_allow_html=True)
     return col2
 
 def render_settings_page():
@@ -425,13 +443,10 @@ def render_settings_page():
         elif current_tab == "Appearance":
             render_settings_section_header("Appearance", "Themes and animations.")
             with render_settings_row("Theme", "Switch mode."):
-                new_theme = st.radio("THEME_SELECT", ["Dark", "Night", "Light"], 
-                                     index=["Dark", "Night", "Light"].index(st.session_state.theme),
-                                     horizontal=True, label_visibility="collapsed")
-                if new_theme != st.session_state.theme:
-                    st.session_state.theme = new_theme
-                    save_settings()
-                    st.rerun()
+                st.radio("THEME_SELECT", ["Dark", "Night", "Light"], 
+                         index=["Dark", "Night", "Light"].index(st.session_state.theme),
+                         key="theme_select", on_change=on_theme_change,
+                         horizontal=True, label_visibility="collapsed")
 
         st.markdown('</div>', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
@@ -444,4 +459,4 @@ elif st.session_state.page == "Library":
 elif st.session_state.page == "Settings":
     render_settings_page()
 
-st.markdown("<br><br><br><p style='text-align: center; color: #64748B; font-size: 0.75rem; font-weight: 500; opacity: 0.6;'>ScholarPulse · Enterprise Research Dashboard · v2.1.0</p>", unsafe_allow_html=True)
+st.markdown("<p style='margin-top: 72px; text-align: center; color: #64748B; font-size: 0.75rem; font-weight: 500; opacity: 0.6;'>ScholarPulse · Enterprise Research Dashboard · v2.1.0</p>", unsafe_allow_html=True)
@@ -5,13 +5,15 @@ Provides structured error responses with error codes, messages,
 and optional retry guidance.
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from rest_framework.views import exception_handler
 from rest_framework.exceptions import APIException
 from rest_framework import status
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 class ScholarPulseException(APIException):
     """Base exception for ScholarPulse API errors."""
@@ -100,13 +102,14 @@ def custom_exception_handler(exc, context):
     
     if response is not None:
         # Extract error details
+        detail = getattr(exc, 'detail', None)
         if isinstance(exc, ScholarPulseException):
             code = exc.default_code
-            message = str(exc.detail) if exc.detail else exc.default_detail
+            message = str(detail) if detail else exc.default_detail
             retry_after = exc.retry_after
         else:
             code = getattr(exc, 'default_code', 'API_ERROR')
-            message = str(exc.detail) if hasattr(exc, 'detail') else str(exc)
+            message = str(detail) if detail is not None else str(exc)
             retry_after = None
         
         # Build structured error response
@@ -114,13 +117,13 @@ def custom_exception_handler(exc, context):
             'error': {
                 'code': code,
                 'message': message,
-                'timestamp': datetime.utcnow().isoformat() + 'Z',
+                'timestamp': datetime.now(_UTC).strftime('%Y-%m-%dT%H:%M:%SZ'),
             }
         }
         
         # Add details if available
-        if hasattr(exc, 'detail') and isinstance(exc.detail, dict):
-            error_data['error']['details'] = exc.detail
+        if isinstance(detail, dict):
+            error_data['error']['details'] = detail
         
         # Add retry_after if applicable
         if retry_after:
@@ -129,12 +132,14 @@ def custom_exception_handler(exc, context):
         
         response.data = error_data
         
-        # Log the error
+        # Log the error (formatted lazily, only if the record is emitted)
+        view = context.get('view')
+        request = context.get('request')
         logger.error(
-            f"API Error: {code} - {message}",
+            "API Error: %s - %s", code, message,
             extra={
-                'view': context.get('view').__class__.__name__ if context.get('view') else None,
-                'request_path': context.get('request').path if context.get('request') else None,
+                'view': view.__class__.__name__ if view else None,
+                'request_path': request.path if request else None,
                 'status_code': response.status_code,
             }
         )
@@ -0,0 +1,39 @@
+"""
+Middleware for ScholarPulse API.
+"""
+import ipaddress
+from typing import Optional
+
+from django.conf import settings
+
+
+def _valid_ip(value: Optional[str]) -> Optional[str]:
+    """The address if it parses as IPv4/IPv6, else None (headers are client-controlled)."""
+    try:
+        return str(ipaddress.ip_address(value.strip())) if value else None
+    except ValueError:
+        return None
+
+
+class ClientIPMiddleware:
+    """
+    Sets ``request.client_ip`` once per request.
+
+    Uses the first X-Forwarded-For entry when the direct peer is a trusted
+    proxy (any peer if TRUSTED_PROXIES is empty), else REMOTE_ADDR. Anything
+    that isn't a valid IP address becomes None.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.trusted_proxies = frozenset(getattr(settings, 'TRUSTED_PROXIES', ()))
+
+    def __call__(self, request):
+        remote_addr = request.META.get('REMOTE_ADDR')
+        forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        if forwarded_for and (not self.trusted_proxies or remote_addr in self.trusted_proxies):
+            first_hop = forwarded_for.partition(',')[0].strip()
+            request.client_ip = _valid_ip(first_hop) if first_hop else _valid_ip(remote_addr)
+        else:
+            request.client_ip = _valid_ip(remote_addr)
+        return self.get_response(request)
@@ -0,0 +1,27 @@
+"""
+Pagination classes for ScholarPulse API.
+"""
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class ResearchTaskCursorPagination(CursorPagination):
+    """Newest-first task pages that seek on the created_at index (no OFFSET scans)."""
+    page_size = 25
+    ordering = '-created_at'
+    cursor_query_param = 'cursor'
+    
+    def cursor_from_link(self, link: Optional[str]) -> Optional[str]:
+        """The opaque cursor token in a page link, so it can be cached without the host."""
+        if not link:
+            return None
+        return parse_qs(urlsplit(link).query).get(self.cursor_query_param, [None])[0]
+    
+    def link_for_cursor(self, request, cursor: Optional[str]) -> Optional[str]:
+        """Absolute page link for a cursor token, built from this request's origin."""
+        if not cursor:
+            return None
+        return replace_query_param(request.build_absolute_uri(), self.cursor_query_param, cursor)
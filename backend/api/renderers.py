@@ -0,0 +1,22 @@
+"""
+Custom renderers for ScholarPulse API.
+"""
+import json
+from rest_framework.renderers import BaseRenderer
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets DRF negotiate ``Accept: text/event-stream``.
+
+    Streaming views return a StreamingHttpResponse and bypass rendering; this
+    only renders error payloads, as a single ``error`` event.
+    """
+    media_type = 'text/event-stream'
+    format = 'sse'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return f"event: error\ndata: {json.dumps(data, default=str)}\n\n".encode(self.charset)
@@ -38,6 +38,12 @@ class ResearchSubmitSerializer(serializers.Serializer):
         if not value or not value.strip():
             raise serializers.ValidationError("Query cannot be empty or whitespace only")
         return value.strip()
+    
+    def validate_year_filter(self, value):
+        """Reject years arXiv's date filter can't express."""
+        if value and value < 1991:
+            raise serializers.ValidationError("Year must be 1991 or later (0 or null = all years)")
+        return value
 
 
 class ResearchSubmitResponseSerializer(serializers.Serializer):
@@ -103,7 +109,7 @@ class ErrorLogSerializer(serializers.Serializer):
     message = serializers.CharField(max_length=1000)
     context = serializers.DictField(required=False)
     stack_trace = serializers.CharField(required=False, allow_blank=True)
-    user_agent = serializers.CharField(required=False, allow_blank=True)
+    user_agent = serializers.CharField(max_length=500, required=False, allow_blank=True)
 
 
 class ResearchListSerializer(serializers.Serializer):
@@ -114,21 +120,11 @@ class ResearchListSerializer(serializers.Serializer):
     status = serializers.CharField()
     created_at = serializers.DateTimeField()
     completed_at = serializers.DateTimeField(allow_null=True)
-    paper_count = serializers.SerializerMethodField()
-    idea_count = serializers.SerializerMethodField()
+    paper_count = serializers.IntegerField()
+    idea_count = serializers.IntegerField()
     
     def get_query(self, obj):
-        return obj.input_params.get('query', 'Unknown')
-    
-    def get_paper_count(self, obj):
-        if obj.output_data and 'papers' in obj.output_data:
-            return len(obj.output_data['papers'])
-        return 0
-    
-    def get_idea_count(self, obj):
-        if obj.output_data and 'ideas' in obj.output_data:
-            return len(obj.output_data['ideas'])
-        return 0
+        return obj.query_preview or 'Unknown'
 
 
 class APIErrorSerializer(serializers.Serializer):
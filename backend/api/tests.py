@@ -0,0 +1,146 @@
+"""
+Tests for the ScholarPulse REST API.
+
+Run with: python manage.py test
+"""
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.views import ResearchStreamView
+from research.cache import publish_task_progress
+from research.models import ResearchTask
+
+
+class ResearchListTests(TestCase):
+    """Cursor-paginated task list and its cached first page."""
+
+    def setUp(self):
+        cache.clear()
+        for i in range(30):
+            ResearchTask.objects.create(input_params={'query': f'topic {i}'})
+
+    def test_pages_cover_every_task_once(self):
+        client = APIClient(SERVER_NAME='localhost')
+        first = client.get(reverse('api:research-list')).json()
+        self.assertEqual(len(first['results']), 25)
+        self.assertIsNone(first['previous'])
+
+        second = client.get(first['next']).json()
+        self.assertEqual(len(second['results']), 5)
+        self.assertIsNone(second['next'])
+
+        ids = {row['task_id'] for row in first['results'] + second['results']}
+        self.assertEqual(len(ids), 30)
+
+    def test_cached_first_page_links_use_each_requests_host(self):
+        first = APIClient(SERVER_NAME='localhost').get(reverse('api:research-list')).json()
+        self.assertTrue(first['next'].startswith('http://localhost/'))
+
+        # Served from the cache, but the link must point at this client's origin
+        other = APIClient(SERVER_NAME='127.0.0.1').get(reverse('api:research-list')).json()
+        self.assertTrue(other['next'].startswith('http://127.0.0.1/'))
+        self.assertEqual(other['results'], first['results'])
+
+    def test_new_task_invalidates_cached_page(self):
+        client = APIClient(SERVER_NAME='localhost')
+        client.get(reverse('api:research-list'))
+        ResearchTask.objects.create(input_params={'query': 'newest'})
+
+        results = client.get(reverse('api:research-list')).json()['results']
+        self.assertEqual(results[0]['query'], 'newest')
+
+
+class ResearchStatusTests(TestCase):
+    """ETag revalidation on the status endpoint."""
+
+    def setUp(self):
+        self.client = APIClient(SERVER_NAME='localhost')
+        self.task = ResearchTask.objects.create(input_params={'query': 'topic'})
+        self.url = reverse('api:research-status', args=[self.task.id])
+
+    def test_unchanged_task_returns_304(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+
+        again = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again['ETag'], first['ETag'])
+
+    def test_progress_change_returns_new_body(self):
+        etag = self.client.get(self.url)['ETag']
+        self.task.update_progress(40, "Searching papers...")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['progress'], 40)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@mock.patch.object(ResearchStreamView, 'POLL_INTERVAL', 0)
+class ResearchStreamTests(TestCase):
+    """Server-Sent Events progress feed."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient(SERVER_NAME='localhost')
+        self.task = ResearchTask.objects.create(input_params={'query': 'topic'})
+        self.url = reverse('api:research-stream', args=[self.task.id])
+
+    def _events(self, response):
+        for chunk in response.streaming_content:
+            text = chunk.decode()
+            if text.startswith('data: '):
+                yield json.loads(text[len('data: '):])
+
+    def test_stream_follows_published_progress_until_finished(self):
+        self.task.mark_running()
+        publish_task_progress(self.task.id, 40, "Generating ideas...")
+
+        events = self._events(self.client.get(self.url, HTTP_ACCEPT='text/event-stream'))
+        first = next(events)
+        self.assertEqual((first['status'], first['progress']), ('RUNNING', 40))
+
+        self.task.mark_completed({'papers': [], 'ideas': []})
+        last = next(events)
+        self.assertEqual((last['status'], last['progress']), ('COMPLETED', 100))
+        self.assertEqual(list(events), [])
+
+    def test_unknown_task_returns_404(self):
+        ResearchTask.objects.all().delete()
+        response = self.client.get(self.url, HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, 404)
+
+
+class ErrorLogViewTests(TestCase):
+    """Validation of frontend error reports before they are queued."""
+
+    def setUp(self):
+        self.client = APIClient(SERVER_NAME='localhost')
+        self.url = reverse('api:error-log')
+
+    def _post(self, **extra):
+        with mock.patch('api.views.enqueue_error_log') as enqueue:
+            response = self.client.post(
+                self.url, {'error_code': 'UI', 'message': 'broke', **extra.pop('data', {})},
+                format='json', **extra,
+            )
+        return response, enqueue
+
+    def test_invalid_forwarded_for_becomes_null_ip(self):
+        response, enqueue = self._post(HTTP_X_FORWARDED_FOR='not-an-ip, 10.0.0.1')
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNone(enqueue.call_args.args[0].ip_address)
+
+    def test_valid_forwarded_for_is_used(self):
+        response, enqueue = self._post(HTTP_X_FORWARDED_FOR='203.0.113.7, 10.0.0.1')
+        self.assertEqual(enqueue.call_args.args[0].ip_address, '203.0.113.7')
+
+    def test_overlong_user_agent_is_rejected(self):
+        response, enqueue = self._post(data={'user_agent': 'x' * 501})
+        self.assertEqual(response.status_code, 400)
+        enqueue.assert_not_called()
@@ -10,6 +10,7 @@ urlpatterns = [
     # Research endpoints
     path('research/submit/', views.ResearchSubmitView.as_view(), name='research-submit'),
     path('research/status/<uuid:task_id>/', views.ResearchStatusView.as_view(), name='research-status'),
+    path('research/stream/<uuid:task_id>/', views.ResearchStreamView.as_view(), name='research-stream'),
     path('research/result/<uuid:task_id>/', views.ResearchResultView.as_view(), name='research-result'),
     path('research/list/', views.ResearchListView.as_view(), name='research-list'),
     path('research/stats/', views.ResearchStatsView.as_view(), name='research-stats'),
@@ -4,16 +4,25 @@ API Views for ScholarPulse REST endpoints.
 Implements:
 - Research task submission
 - Task status polling
+- Task status streaming (SSE)
 - Result retrieval
 - Task cancellation
 - Error logging
 - Health check
 """
+import json
 import logging
+import time
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.http import HttpResponseNotModified, StreamingHttpResponse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 
 from .serializers import (
     ResearchSubmitSerializer,
@@ -23,13 +32,23 @@ from .serializers import (
     ResearchListSerializer,
     ErrorLogSerializer,
 )
+from .pagination import ResearchTaskCursorPagination
+from .renderers import EventStreamRenderer
 from .exceptions import (
     ValidationError,
     TaskNotFoundError,
     TaskAlreadyCompletedError,
 )
 from research.models import ResearchTask, ErrorLog
-from research.services import AgentService
+from research.cache import (
+    LIST_CACHE_KEY,
+    LIST_CACHE_TTL,
+    STATS_CACHE_KEY,
+    STATS_CACHE_TTL,
+    get_published_state,
+)
+from research.error_queue import enqueue_error_log
+from research.tasks import enqueue_research_task
 
 logger = logging.getLogger(__name__)
 
@@ -62,13 +81,11 @@ class ResearchSubmitView(APIView):
         
         logger.info(f"Created research task {task.id} for query: {validated_data['query'][:50]}")
         
-        # Execute research synchronously for MVP
-        # In production, this should be a Celery task
+        # Run the pipeline off the request path; clients poll the status endpoint
         try:
-            service = AgentService(task_id=str(task.id))
-            service.execute(task)
+            enqueue_research_task(str(task.id))
         except Exception as e:
-            logger.error(f"Task {task.id} failed during execution: {e}", exc_info=True)
+            logger.error(f"Task {task.id} could not be scheduled: {e}", exc_info=True)
             task.mark_failed(
                 error_code='EXECUTION_ERROR',
                 error_message=str(e)
@@ -92,25 +109,119 @@ class ResearchStatusView(APIView):
     GET /api/research/status/<task_id>/
     
     Poll the status of a research task.
+    Supports If-None-Match; unchanged tasks return 304 with no body.
     """
     
+    STATUS_FIELDS = (
+        'id', 'status', 'progress', 'current_step',
+        'started_at', 'completed_at', 'error_data', 'updated_at',
+    )
+    
     def get(self, request, task_id):
         try:
-            task = ResearchTask.objects.get(id=task_id)
+            # Polled every few seconds: skip input_params
+            task = ResearchTask.objects.only(*self.STATUS_FIELDS).get(id=task_id)
         except ResearchTask.DoesNotExist:
             raise TaskNotFoundError(f"Task {task_id} not found")
         
-        response_data = {
-            'task_id': task.id,
-            'status': task.status,
-            'progress': task.progress,
-            'current_step': task.current_step,
-            'started_at': task.started_at,
-            'completed_at': task.completed_at,
-            'error': task.error_data,
-        }
+        # Every state change bumps updated_at, so it identifies this representation
+        etag = f'"{task.updated_at.timestamp()}-{task.progress}"'
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponseNotModified()
+        else:
+            response = Response({
+                'task_id': task.id,
+                'status': task.status,
+                'progress': task.progress,
+                'current_step': task.current_step,
+                'started_at': task.started_at,
+                'completed_at': task.completed_at,
+                'error': task.error_data,
+            })
         
-        return Response(response_data)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache, must-revalidate'
+        return response
+
+
+class ResearchStreamView(APIView):
+    """
+    GET /api/research/stream/<task_id>/
+    
+    Server-Sent Events feed of a task's status.
+    Sends an event whenever status, progress or step changes and closes once
+    the task finishes, or after MAX_DURATION; EventSource then reconnects.
+    Each open stream occupies a request thread, so render.yaml runs gunicorn
+    with gthread workers.
+    
+    Live updates come from the state tasks publish to the cache; the database
+    is only read every DB_POLL_INTERVAL seconds and once the task finishes.
+    """
+    
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+    
+    POLL_INTERVAL = 0.5
+    DB_POLL_INTERVAL = 10.0
+    HEARTBEAT_INTERVAL = 15.0
+    # Below gunicorn's 180s --timeout, so a stream never outlives its worker
+    MAX_DURATION = 150.0
+    
+    def get(self, request, task_id):
+        if not ResearchTask.objects.filter(id=task_id).exists():
+            raise TaskNotFoundError(f"Task {task_id} not found")
+        
+        response = StreamingHttpResponse(self._events(task_id), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Don't let proxies buffer the stream
+        return response
+    
+    def _events(self, task_id):
+        last_state = None
+        row = None
+        started = last_sent = time.monotonic()
+        last_db_read = float('-inf')
+        
+        while time.monotonic() - started < self.MAX_DURATION:
+            published = get_published_state(task_id)
+            if (
+                row is None
+                or time.monotonic() - last_db_read >= self.DB_POLL_INTERVAL
+                or published.get('status') in ResearchTask.TERMINAL_STATUSES
+            ):
+                row = (
+                    ResearchTask.objects.filter(id=task_id)
+                    .values('status', 'progress', 'current_step', 'error_data')
+                    .first()
+                )
+                last_db_read = time.monotonic()
+                if row is None:
+                    return
+            
+            # Published progress runs ahead of the coalesced database writes;
+            # a finished task's row is authoritative
+            current = dict(row)
+            if row['status'] not in ResearchTask.TERMINAL_STATUSES:
+                current.update(published)
+            
+            state = (current['status'], current['progress'], current['current_step'])
+            if state != last_state:
+                last_state = state
+                last_sent = time.monotonic()
+                payload = {
+                    'task_id': str(task_id),
+                    'status': current['status'],
+                    'progress': current['progress'],
+                    'current_step': current['current_step'],
+                    'error': current['error_data'],
+                }
+                yield f"data: {json.dumps(payload)}\n\n"
+            elif time.monotonic() - last_sent >= self.HEARTBEAT_INTERVAL:
+                last_sent = time.monotonic()
+                yield ": keep-alive\n\n"
+            
+            if row['status'] in ResearchTask.TERMINAL_STATUSES:
+                return
+            time.sleep(self.POLL_INTERVAL)
 
 
 class ResearchResultView(APIView):
@@ -122,7 +233,7 @@ class ResearchResultView(APIView):
     
     def get(self, request, task_id):
         try:
-            task = ResearchTask.objects.get(id=task_id)
+            task = ResearchTask.objects.select_related('result').get(id=task_id)
         except ResearchTask.DoesNotExist:
             raise TaskNotFoundError(f"Task {task_id} not found")
         
@@ -160,7 +271,8 @@ class ResearchResultView(APIView):
             )
         
         # Task completed - return results
-        output = task.output_data or {}
+        result = getattr(task, 'result', None)
+        output = result.output_data if result else {}
         response_data = {
             'task_id': task.id,
             'query': task.input_params.get('query', ''),
@@ -182,23 +294,28 @@ class ResearchCancelView(APIView):
     """
     
     def post(self, request, task_id):
-        try:
-            task = ResearchTask.objects.get(id=task_id)
-        except ResearchTask.DoesNotExist:
-            raise TaskNotFoundError(f"Task {task_id} not found")
+        # Lock the row (PostgreSQL) so the worker can't finish the task mid-cancel;
+        # mark_cancelled() is also a conditional UPDATE, which covers SQLite
+        with transaction.atomic():
+            try:
+                task = ResearchTask.objects.select_for_update().only('id', 'status').get(id=task_id)
+            except ResearchTask.DoesNotExist:
+                raise TaskNotFoundError(f"Task {task_id} not found")
+            
+            cancelled = task.status not in ResearchTask.TERMINAL_STATUSES and task.mark_cancelled()
         
-        if task.status in [ResearchTask.Status.COMPLETED, ResearchTask.Status.FAILED]:
+        if not cancelled:
+            # The status may have changed since it was read
+            task.refresh_from_db(fields=['status'])
+            if task.status == ResearchTask.Status.CANCELLED:
+                return Response(
+                    {'message': 'Task already cancelled', 'task_id': task.id},
+                    status=status.HTTP_200_OK
+                )
             raise TaskAlreadyCompletedError(
                 f"Cannot cancel task in {task.status} state"
             )
         
-        if task.status == ResearchTask.Status.CANCELLED:
-            return Response(
-                {'message': 'Task already cancelled', 'task_id': task.id},
-                status=status.HTTP_200_OK
-            )
-        
-        task.mark_cancelled()
         logger.info(f"Task {task_id} cancelled")
         
         return Response(
@@ -225,23 +342,17 @@ class ErrorLogView(APIView):
         
         validated_data = serializer.validated_data
         
-        # Get client IP
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip_address = x_forwarded_for.split(',')[0]
-        else:
-            ip_address = request.META.get('REMOTE_ADDR')
-        
-        # Create error log
-        error_log = ErrorLog.objects.create(
+        # Queue the error log; it is written in batches in the background
+        error_log = ErrorLog(
             source=ErrorLog.Source.FRONTEND,
             error_code=validated_data['error_code'],
             message=validated_data['message'],
             context=validated_data.get('context'),
             stack_trace=validated_data.get('stack_trace', ''),
             user_agent=validated_data.get('user_agent', ''),
-            ip_address=ip_address,
+            ip_address=request.client_ip,
         )
+        enqueue_error_log(error_log)
         
         logger.warning(
             f"Frontend error logged: {validated_data['error_code']} - {validated_data['message'][:100]}"
@@ -257,13 +368,41 @@ class ResearchListView(APIView):
     """
     GET /api/research/list/
     
-    List all research tasks.
+    List research tasks, newest first, 25 per page.
+    Returns {next, previous, results}; follow `next` for older tasks.
     """
     
+    pagination_class = ResearchTaskCursorPagination
+    
     def get(self, request):
-        tasks = ResearchTask.objects.all().order_by('-created_at')
-        serializer = ResearchListSerializer(tasks, many=True)
-        return Response(serializer.data)
+        paginator = self.pagination_class()
+        if paginator.cursor_query_param in request.query_params:
+            return self._build_page(request, paginator)
+        
+        # Only the first page is polled by the dashboard, so only it is cached.
+        # The cache holds the rows and the next cursor; links are absolute
+        # URLs for whoever asked, so they are rebuilt per request.
+        cached = cache.get(LIST_CACHE_KEY)
+        if cached is None:
+            page = self._build_page(request, paginator).data
+            cached = {
+                'results': page['results'],
+                'next_cursor': paginator.cursor_from_link(page['next']),
+            }
+            cache.set(LIST_CACHE_KEY, cached, LIST_CACHE_TTL)
+        return Response({
+            'next': paginator.link_for_cursor(request, cached['next_cursor']),
+            'previous': None,
+            'results': cached['results'],
+        })
+    
+    def _build_page(self, request, paginator):
+        # Only the denormalized list columns; no JSON is loaded
+        tasks = ResearchTask.objects.only(
+            'id', 'status', 'query_preview', 'paper_count', 'idea_count', 'created_at', 'completed_at',
+        )
+        page = paginator.paginate_queryset(tasks, request, view=self)
+        return paginator.get_paginated_response(ResearchListSerializer(page, many=True).data)
 
 
 class ResearchStatsView(APIView):
@@ -274,18 +413,17 @@ class ResearchStatsView(APIView):
     """
     
     def get(self, request):
-        completed_tasks = ResearchTask.objects.filter(status=ResearchTask.Status.COMPLETED)
-        
-        total_papers = 0
-        for task in completed_tasks:
-            if task.output_data and 'papers' in task.output_data:
-                total_papers += len(task.output_data['papers'])
-        
-        return Response({
-            'total_papers': total_papers,
-            'total_searches': ResearchTask.objects.count(),
-            'total_reports': completed_tasks.count(),
-        })
+        return Response(cache.get_or_set(STATS_CACHE_KEY, self._build_stats, STATS_CACHE_TTL))
+    
+    @staticmethod
+    def _build_stats():
+        # One aggregate query over the denormalized paper_count column
+        completed = Q(status=ResearchTask.Status.COMPLETED)
+        return ResearchTask.objects.aggregate(
+            total_papers=Coalesce(Sum('paper_count', filter=completed), 0),
+            total_searches=Count('id'),
+            total_reports=Count('id', filter=completed),
+        )
 
 
 class HealthCheckView(APIView):
@@ -1,17 +1,26 @@
 from django.contrib import admin
-from .models import ResearchTask, ErrorLog
+from .models import ResearchTask, ResearchTaskResult, CachedArxivQuery, ErrorLog
 
 
 @admin.register(ResearchTask)
 class ResearchTaskAdmin(admin.ModelAdmin):
-    list_display = ['id', 'get_query', 'status', 'progress', 'created_at', 'completed_at']
+    list_display = ['id', 'query_preview', 'status', 'progress', 'paper_count', 'created_at', 'completed_at']
     list_filter = ['status', 'created_at']
-    search_fields = ['id', 'input_params']
-    readonly_fields = ['id', 'created_at', 'updated_at']
-    
-    def get_query(self, obj):
-        return obj.input_params.get('query', 'N/A')[:50]
-    get_query.short_description = 'Query'
+    search_fields = ['id', 'query_preview']
+    readonly_fields = ['id', 'query_preview', 'paper_count', 'idea_count', 'created_at', 'updated_at']
+
+
+@admin.register(ResearchTaskResult)
+class ResearchTaskResultAdmin(admin.ModelAdmin):
+    list_display = ['task']
+    raw_id_fields = ['task']
+
+
+@admin.register(CachedArxivQuery)
+class CachedArxivQueryAdmin(admin.ModelAdmin):
+    list_display = ['query', 'max_results', 'fetched_at']
+    search_fields = ['query']
+    readonly_fields = ['query_hash', 'fetched_at']
 
 
 @admin.register(ErrorLog)
@@ -0,0 +1,20 @@
+"""
+Access to the agent package that lives beside the Django project.
+
+The agent modules (agent/, config.py, utils.py) sit in the repository root,
+one level above backend/, so that root has to be on sys.path before they are
+imported.
+"""
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+AGENT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+@lru_cache(maxsize=None)
+def ensure_agent_root_on_path():
+    """Put AGENT_ROOT on sys.path once per process."""
+    root = str(AGENT_ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
@@ -5,3 +5,8 @@ class ResearchConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'research'
     verbose_name = 'ScholarPulse Research'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .agent_path import ensure_agent_root_on_path
+        ensure_agent_root_on_path()
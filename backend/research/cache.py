@@ -0,0 +1,51 @@
+"""
+Cache keys for read-mostly research endpoints.
+
+The task list and stats only change when a task is created, deleted or
+changes state, so they are cached and invalidated by research.signals.
+
+Running tasks also publish their live status and progress here, so the
+progress stream can follow a task without querying the database each tick.
+"""
+from django.core.cache import cache
+
+STATS_CACHE_KEY = 'research:stats'
+LIST_CACHE_KEY = 'research:list'
+
+STATS_CACHE_TTL = 60
+LIST_CACHE_TTL = 30
+
+
+def invalidate_task_caches():
+    """Drop cached list/stats responses after a task changes."""
+    cache.delete_many([STATS_CACHE_KEY, LIST_CACHE_KEY])
+
+
+TASK_STATE_TTL = 900
+
+
+def _status_key(task_id) -> str:
+    return f'research:status:{task_id}'
+
+
+def _progress_key(task_id) -> str:
+    return f'research:progress:{task_id}'
+
+
+def publish_task_status(task_id, status: str):
+    """Announce a task status change to progress streams."""
+    cache.set(_status_key(task_id), status, TASK_STATE_TTL)
+
+
+def publish_task_progress(task_id, progress: int, current_step: str):
+    """Announce progress ahead of the (coalesced) database write."""
+    cache.set(_progress_key(task_id), {'progress': progress, 'current_step': current_step}, TASK_STATE_TTL)
+
+
+def get_published_state(task_id) -> dict:
+    """Latest published status/progress/current_step for a task (may be empty)."""
+    values = cache.get_many([_status_key(task_id), _progress_key(task_id)])
+    state = dict(values.get(_progress_key(task_id)) or {})
+    if _status_key(task_id) in values:
+        state['status'] = values[_status_key(task_id)]
+    return state
@@ -0,0 +1,97 @@
+"""
+Buffered writes for frontend ErrorLog entries.
+
+A burst of frontend errors would otherwise cost one INSERT and commit per
+request. Entries are queued in-process and a background thread writes them in
+batches of up to ERROR_LOG_BATCH_SIZE, at least every ERROR_LOG_FLUSH_INTERVAL
+seconds. Whatever is still queued is written when the process exits.
+"""
+import atexit
+import logging
+import queue
+import threading
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+ERROR_LOG_QUEUE_SIZE = 10000
+ERROR_LOG_BATCH_SIZE = 100
+ERROR_LOG_FLUSH_INTERVAL = 1.0
+
+_queue = queue.Queue(maxsize=ERROR_LOG_QUEUE_SIZE)
+_stop = threading.Event()
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def enqueue_error_log(error_log) -> bool:
+    """Queue an unsaved ErrorLog for writing. Returns False if it was dropped."""
+    _ensure_writer()
+    try:
+        _queue.put_nowait(error_log)
+        return True
+    except queue.Full:
+        logger.warning(f"Error log queue full, dropping {error_log.error_code}")
+        return False
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_run_writer, name='errorlog-writer', daemon=True)
+            _writer.start()
+            atexit.register(_shutdown)
+
+
+def _next_batch(timeout: float) -> list:
+    """Block up to ``timeout`` for the first entry, then take what is queued."""
+    try:
+        batch = [_queue.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    while len(batch) < ERROR_LOG_BATCH_SIZE:
+        try:
+            batch.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write(batch: list):
+    from research.models import ErrorLog
+
+    close_old_connections()
+    try:
+        with transaction.atomic():
+            ErrorLog.objects.bulk_create(batch)
+        return
+    except Exception as e:
+        logger.warning(f"Batch insert of {len(batch)} error logs failed ({e}), retrying one by one")
+
+    # One bad row shouldn't cost the rest of the batch
+    for error_log in batch:
+        try:
+            with transaction.atomic():
+                error_log.save(force_insert=True)
+        except Exception as e:
+            logger.error(f"Dropped error log {error_log.id} ({error_log.error_code}): {e}")
+
+
+def _run_writer():
+    while not _stop.is_set():
+        batch = _next_batch(ERROR_LOG_FLUSH_INTERVAL)
+        if batch:
+            _write(batch)
+
+    # Drain on shutdown
+    while batch := _next_batch(0):
+        _write(batch)
+    close_old_connections()
+
+
+def _shutdown():
+    _stop.set()
+    _writer.join(timeout=5)
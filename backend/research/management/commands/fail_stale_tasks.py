@@ -0,0 +1,23 @@
+"""
+Mark research tasks orphaned by a dead worker as failed.
+
+Run at startup (see render.yaml) or from cron alongside a Celery worker.
+"""
+from django.core.management.base import BaseCommand
+
+from research.tasks import fail_stale_tasks
+
+
+class Command(BaseCommand):
+    help = "Mark RUNNING tasks with no progress for STALE_TASK_TIMEOUT seconds as FAILED"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age', type=int, default=None,
+            help="Seconds without progress (default: STALE_TASK_TIMEOUT). Use 0 at startup "
+                 "when tasks only run in the web process, since none can still be alive.",
+        )
+
+    def handle(self, *args, **options):
+        failed = fail_stale_tasks(options['max_age'])
+        self.stdout.write(f"Marked {failed} stale task(s) as failed")
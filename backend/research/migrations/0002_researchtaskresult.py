@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:48
+
+from itertools import islice
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 100
+
+
+def move_output_data(apps, schema_editor):
+    ResearchTask = apps.get_model('research', 'ResearchTask')
+    ResearchTaskResult = apps.get_model('research', 'ResearchTaskResult')
+    tasks = (
+        ResearchTask.objects.filter(output_data__isnull=False)
+        .only('id', 'output_data')
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    # Insert a batch at a time so only BATCH_SIZE payloads are held in memory
+    while batch := [
+        ResearchTaskResult(task_id=task.id, output_data=task.output_data)
+        for task in islice(tasks, BATCH_SIZE)
+    ]:
+        ResearchTaskResult.objects.bulk_create(batch)
+
+
+def restore_output_data(apps, schema_editor):
+    ResearchTask = apps.get_model('research', 'ResearchTask')
+    ResearchTaskResult = apps.get_model('research', 'ResearchTaskResult')
+    for result in ResearchTaskResult.objects.iterator():
+        ResearchTask.objects.filter(id=result.task_id).update(output_data=result.output_data)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResearchTaskResult',
+            fields=[
+                ('task', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='result', serialize=False, to='research.researchtask')),
+                ('output_data', models.JSONField(help_text='Research results: papers, ideas, report_sections, report_formats')),
+            ],
+            options={
+                'verbose_name': 'Research Task Result',
+                'verbose_name_plural': 'Research Task Results',
+            },
+        ),
+        migrations.RunPython(move_output_data, restore_output_data),
+        migrations.RemoveField(
+            model_name='researchtask',
+            name='output_data',
+        ),
+    ]
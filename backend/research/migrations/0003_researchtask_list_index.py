@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0002_researchtaskresult'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='researchtask',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name='researchtask',
+            index=models.Index(fields=['-created_at'], include=('status', 'completed_at'), name='research_task_list_idx'),
+        ),
+    ]
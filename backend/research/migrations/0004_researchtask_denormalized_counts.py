@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:55
+
+from django.db import migrations, models
+
+
+def fill_denormalized_columns(apps, schema_editor):
+    ResearchTask = apps.get_model('research', 'ResearchTask')
+    ResearchTaskResult = apps.get_model('research', 'ResearchTaskResult')
+    for task in ResearchTask.objects.only('id', 'input_params').iterator():
+        query = (task.input_params or {}).get('query', '')
+        ResearchTask.objects.filter(id=task.id).update(query_preview=str(query)[:500])
+    for result in ResearchTaskResult.objects.iterator():
+        output_data = result.output_data or {}
+        ResearchTask.objects.filter(id=result.task_id).update(
+            paper_count=len(output_data.get('papers') or []),
+            idea_count=len(output_data.get('ideas') or []),
+        )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0003_researchtask_list_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='researchtask',
+            name='idea_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='researchtask',
+            name='paper_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='researchtask',
+            name='query_preview',
+            field=models.CharField(blank=True, default='', max_length=500),
+        ),
+        migrations.RunPython(fill_denormalized_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0004_researchtask_denormalized_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CachedArxivQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query_hash', models.CharField(max_length=64, unique=True)),
+                ('query', models.TextField()),
+                ('max_results', models.IntegerField()),
+                ('papers', models.JSONField()),
+                ('fetched_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Cached arXiv Query',
+                'verbose_name_plural': 'Cached arXiv Queries',
+            },
+        ),
+    ]
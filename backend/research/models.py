@@ -6,10 +6,15 @@ Minimal schema designed for easy PostgreSQL migration:
 - Uses JSONField for flexible data storage
 - All fields use database-agnostic types
 """
+import hashlib
 import uuid
-from django.db import models
+from datetime import timedelta
+from typing import Optional
+from django.db import models, transaction
 from django.utils import timezone
 
+from .cache import invalidate_task_caches, publish_task_status
+
 
 class ResearchTask(models.Model):
     """
@@ -28,6 +33,9 @@ class ResearchTask(models.Model):
         FAILED = 'FAILED', 'Failed'
         CANCELLED = 'CANCELLED', 'Cancelled'
     
+    # States a task never leaves
+    TERMINAL_STATUSES = frozenset({Status.COMPLETED, Status.FAILED, Status.CANCELLED})
+    
     # Primary key - UUID for distributed safety
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     
@@ -47,12 +55,10 @@ class ResearchTask(models.Model):
         help_text="Research parameters: query, mode, year_filter, llm_provider"
     )
     
-    # Output results (stored as JSON)
-    output_data = models.JSONField(
-        null=True,
-        blank=True,
-        help_text="Research results: papers, ideas, report_sections, report_formats"
-    )
+    # Denormalized copies for listing, admin and stats, so they never parse JSON
+    query_preview = models.CharField(max_length=500, blank=True, default='')
+    paper_count = models.IntegerField(default=0)
+    idea_count = models.IntegerField(default=0)
     
     # Error information
     error_data = models.JSONField(
@@ -62,7 +68,7 @@ class ResearchTask(models.Model):
     )
     
     # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -73,50 +79,204 @@ class ResearchTask(models.Model):
         verbose_name_plural = 'Research Tasks'
         indexes = [
             models.Index(fields=['status', 'created_at']),
+            # Newest-first task list; on PostgreSQL the list columns are
+            # carried in the index (INCLUDE is ignored on SQLite)
+            models.Index(
+                fields=['-created_at'],
+                include=['status', 'completed_at'],
+                name='research_task_list_idx',
+            ),
         ]
     
     def __str__(self):
         query = self.input_params.get('query', 'Unknown')[:50]
         return f"{self.id} - {query} ({self.status})"
     
-    def mark_running(self):
-        """Mark task as running."""
-        self.status = self.Status.RUNNING
-        self.started_at = timezone.now()
-        self.save(update_fields=['status', 'started_at', 'updated_at'])
-    
-    def mark_completed(self, output_data: dict):
-        """Mark task as completed with results."""
-        self.status = self.Status.COMPLETED
-        self.progress = 100
-        self.output_data = output_data
-        self.completed_at = timezone.now()
-        self.save(update_fields=['status', 'progress', 'output_data', 'completed_at', 'updated_at'])
-    
-    def mark_failed(self, error_code: str, error_message: str, traceback: str = None):
-        """Mark task as failed with error details."""
-        self.status = self.Status.FAILED
-        self.error_data = {
-            'code': error_code,
-            'message': error_message,
-            'traceback': traceback,
-            'failed_at': timezone.now().isoformat()
-        }
-        self.completed_at = timezone.now()
-        self.save(update_fields=['status', 'error_data', 'completed_at', 'updated_at'])
-    
-    def mark_cancelled(self):
-        """Mark task as cancelled."""
-        self.status = self.Status.CANCELLED
-        self.completed_at = timezone.now()
-        self.save(update_fields=['status', 'completed_at', 'updated_at'])
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.query_preview:
+            self.query_preview = str(self.input_params.get('query', ''))[:500]
+        super().save(*args, **kwargs)
+    
+    def _update_columns(self, from_statuses=None, **fields) -> bool:
+        """
+        Write only the given columns with a single UPDATE ... WHERE id=?.
+        
+        Unlike save(), nothing else on the instance (notably the JSON columns)
+        is written back, so a stale in-memory copy can't clobber other writers.
+        With ``from_statuses`` the row is only updated while its status is one
+        of them, so state transitions can't race each other.
+        
+        Returns False (leaving the instance untouched) if no row was updated.
+        """
+        fields['updated_at'] = timezone.now()
+        queryset = ResearchTask.objects.filter(pk=self.pk)
+        if from_statuses is not None:
+            queryset = queryset.filter(status__in=from_statuses)
+        if not queryset.update(**fields):
+            return False
+        
+        for name, value in fields.items():
+            setattr(self, name, value)
+        if 'status' in fields:
+            # Queryset updates skip post_save, which normally drops these caches
+            invalidate_task_caches()
+            publish_task_status(self.pk, self.status)
+        return True
+    
+    def is_cancelled(self) -> bool:
+        """Check the database (not this instance) for a cancellation."""
+        return ResearchTask.objects.filter(pk=self.pk, status=self.Status.CANCELLED).exists()
+    
+    def mark_running(self) -> bool:
+        """Mark a pending task as running. Returns False if it is no longer pending."""
+        return self._update_columns(
+            from_statuses=[self.Status.PENDING],
+            status=self.Status.RUNNING,
+            started_at=timezone.now(),
+        )
+    
+    def mark_completed(self, output_data: dict) -> bool:
+        """
+        Mark task as completed and store its results in ResearchTaskResult.
+        
+        Returns False without storing anything if the task was cancelled.
+        """
+        with transaction.atomic():
+            current_status = (
+                ResearchTask.objects.select_for_update()
+                .filter(pk=self.pk)
+                .values_list('status', flat=True)
+                .first()
+            )
+            if current_status == self.Status.CANCELLED:
+                self.status = current_status
+                return False
+            
+            self.status = self.Status.COMPLETED
+            self.progress = 100
+            self.completed_at = timezone.now()
+            self.paper_count = len(output_data.get('papers') or [])
+            self.idea_count = len(output_data.get('ideas') or [])
+            ResearchTaskResult.objects.update_or_create(
+                task=self, defaults={'output_data': output_data}
+            )
+            self.save(update_fields=[
+                'status', 'progress', 'completed_at', 'paper_count', 'idea_count', 'updated_at',
+            ])
+        publish_task_status(self.pk, self.status)
+        return True
+    
+    def mark_failed(self, error_code: str, error_message: str, traceback: str = None) -> bool:
+        """
+        Mark a pending or running task as failed with error details.
+        
+        Returns False if it already finished, so a late error can't overwrite
+        a cancellation.
+        """
+        now = timezone.now()
+        return self._update_columns(
+            from_statuses=[self.Status.PENDING, self.Status.RUNNING],
+            status=self.Status.FAILED,
+            error_data={
+                'code': error_code,
+                'message': error_message,
+                'traceback': traceback,
+                'failed_at': now.isoformat()
+            },
+            completed_at=now,
+        )
+    
+    def mark_cancelled(self) -> bool:
+        """Mark a pending or running task as cancelled. Returns False if it already finished."""
+        return self._update_columns(
+            from_statuses=[self.Status.PENDING, self.Status.RUNNING],
+            status=self.Status.CANCELLED,
+            completed_at=timezone.now(),
+        )
     
     def update_progress(self, progress: int, current_step: str = None):
         """Update task progress."""
-        self.progress = min(max(progress, 0), 100)
+        fields = {'progress': min(max(progress, 0), 100)}
         if current_step:
-            self.current_step = current_step
-        self.save(update_fields=['progress', 'current_step', 'updated_at'])
+            fields['current_step'] = current_step
+        self._update_columns(**fields)
+
+
+class ResearchTaskResult(models.Model):
+    """
+    Results of a completed research task.
+    
+    Kept out of ResearchTask so the rows read by status polling and task
+    listing stay small; only the result endpoint loads this table.
+    """
+    
+    task = models.OneToOneField(
+        ResearchTask,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='result'
+    )
+    
+    # Output results (stored as JSON)
+    output_data = models.JSONField(
+        help_text="Research results: papers, ideas, report_sections, report_formats"
+    )
+    
+    class Meta:
+        verbose_name = 'Research Task Result'
+        verbose_name_plural = 'Research Task Results'
+    
+    def __str__(self):
+        return f"Result for {self.task_id}"
+
+
+class CachedArxivQuery(models.Model):
+    """
+    Raw arXiv results for a search query, reused across tasks.
+    
+    Papers are stored before LLM enrichment, so a cache hit only skips the
+    arXiv round-trip; enrichment still runs (and has its own response cache).
+    """
+    
+    query_hash = models.CharField(max_length=64, unique=True)
+    query = models.TextField()
+    max_results = models.IntegerField()
+    papers = models.JSONField()
+    fetched_at = models.DateTimeField(db_index=True)
+    
+    class Meta:
+        verbose_name = 'Cached arXiv Query'
+        verbose_name_plural = 'Cached arXiv Queries'
+    
+    def __str__(self):
+        return f"{self.query[:50]} ({len(self.papers)} papers)"
+    
+    @staticmethod
+    def hash_query(query: str, max_results: int) -> str:
+        return hashlib.sha256(f"{max_results}:{query}".encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def lookup(cls, query: str, max_results: int, max_age: timedelta) -> Optional[list]:
+        """Cached papers for the query, or None if missing or older than max_age."""
+        return (
+            cls.objects
+            .filter(query_hash=cls.hash_query(query, max_results), fetched_at__gte=timezone.now() - max_age)
+            .values_list('papers', flat=True)
+            .first()
+        )
+    
+    @classmethod
+    def store(cls, query: str, max_results: int, papers: list):
+        """Save (or refresh) the results for a query."""
+        cls.objects.update_or_create(
+            query_hash=cls.hash_query(query, max_results),
+            defaults={
+                'query': query,
+                'max_results': max_results,
+                'papers': papers,
+                'fetched_at': timezone.now(),
+            },
+        )
 
 
 class ErrorLog(models.Model):
@@ -4,20 +4,152 @@ Agent Service - Bridges Django backend with existing research agents.
 This service wraps the existing AgentRunner logic and integrates it
 with Django's database and error handling.
 """
-import sys
 import os
+import copy
+import hashlib
+import json
+import time
+import threading
 import logging
 import traceback
+from concurrent.futures import Future
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable
 from django.conf import settings
+from django.db import close_old_connections, connection, transaction
 
-# Add parent directory to path to import existing agent modules
-AGENT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
-sys.path.insert(0, str(AGENT_ROOT))
+from research.agent_path import AGENT_ROOT, ensure_agent_root_on_path
+
+# Normally already done in ResearchConfig.ready(); a no-op then
+ensure_agent_root_on_path()
+
+from agent.lit_review import LiteratureReviewer
+from agent.hypothesis import HypothesisGenerator
+from utils import clean_json_string
+from research.cache import publish_task_progress
+from research.models import CachedArxivQuery, ErrorLog
+from .llm_cache import CachedLLMClient
 
 logger = logging.getLogger(__name__)
 
+# Report file extensions and the labels they are exposed under in the API
+REPORT_FORMATS = (
+    ('.md', 'markdown'),
+    ('.docx', 'word'),
+    ('.txt', 'text'),
+    ('.json', 'json'),
+)
+
+# Tracebacks are stored tail-first up to this many characters
+MAX_TRACEBACK_CHARS = 8000
+
+# Identical tasks running in this process, keyed by _single_flight_key
+_inflight: dict = {}
+_inflight_lock = threading.Lock()
+
+# Longest a duplicate task waits for the identical run before doing its own
+SINGLE_FLIGHT_WAIT = 300
+
+# Minimum seconds between background progress writes for a task
+PROGRESS_WRITE_INTERVAL = 0.25
+
+
+class ProgressWriter(threading.Thread):
+    """
+    Writes a task's progress off the pipeline thread.
+    
+    Only the latest (progress, step) is kept, and it is written at most every
+    PROGRESS_WRITE_INTERVAL seconds, so bursts of updates collapse into one
+    UPDATE and the pipeline never waits on the database lock. close() writes
+    whatever is still pending before returning.
+    """
+    
+    def __init__(self, task):
+        super().__init__(name=f"progress-{str(task.pk)[:8]}", daemon=True)
+        self.task = task
+        self._cond = threading.Condition()
+        self._pending = None
+        self._closed = False
+        self._last_write = 0.0
+    
+    def submit(self, progress: int, step: str):
+        with self._cond:
+            self._pending = (progress, step)
+            self._cond.notify()
+    
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.join()
+    
+    def run(self):
+        try:
+            while True:
+                with self._cond:
+                    while self._pending is None and not self._closed:
+                        self._cond.wait()
+                    if self._pending is None:
+                        return
+                    # Rate limit, but never delay a close
+                    while not self._closed:
+                        delay = PROGRESS_WRITE_INTERVAL - (time.monotonic() - self._last_write)
+                        if delay <= 0:
+                            break
+                        self._cond.wait(delay)
+                    progress, step = self._pending
+                    self._pending = None
+                
+                try:
+                    # Drop a broken or expired connection (or hand a pooled one back)
+                    # rather than holding it across the idle gaps between writes
+                    close_old_connections()
+                    self.task.update_progress(progress, step)
+                except Exception as e:
+                    logger.warning(f"Task {self.task.pk}: progress write failed: {e}")
+                self._last_write = time.monotonic()
+        finally:
+            # This thread has its own DB connection; don't leave it open
+            connection.close()
+
+
+@lru_cache(maxsize=64)
+def _year_clause(year: int) -> str:
+    """arXiv submittedDate range covering one calendar year."""
+    if not 1000 <= year <= 9999:
+        raise ValueError(f"year_filter must be a 4-digit year, got {year}")
+    return f"submittedDate:[{year}01010000 TO {year}12312359]"
+
+
+def _single_flight_key(query: str, mode: str, year_filter, llm_provider: str) -> str:
+    raw = f"{query.strip().lower()}|{mode}|{year_filter}|{llm_provider}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class TaskCancelled(Exception):
+    """Raised between pipeline phases when the task was cancelled."""
+
+
+@lru_cache(maxsize=4)
+def _get_agents(llm_provider: str):
+    """
+    Reviewer and idea generator for a provider, built once per process.
+    
+    Both share one LLM client, so its SDK HTTP connection pools stay warm
+    across tasks instead of being rebuilt (and re-handshaken) each time,
+    and repeated prompts are answered from the LLM response cache.
+    """
+    reviewer = LiteratureReviewer(llm_provider=llm_provider, llm=CachedLLMClient())
+    return reviewer, HypothesisGenerator(llm_provider=llm_provider, llm=reviewer.llm)
+
+
+@lru_cache(maxsize=4)
+def _get_reporter(out_dir: str):
+    from agent.report import ReportGenerator
+    return ReportGenerator(out_dir=out_dir)
+
 
 class AgentService:
     """
@@ -33,6 +165,7 @@ class AgentService:
     def __init__(self, task_id: str, on_progress: Optional[Callable] = None):
         self.task_id = task_id
         self.on_progress = on_progress
+        self._progress_writer = None
         self.output_dir = getattr(settings, 'SCHOLARPULSE_OUTPUT_DIR', str(AGENT_ROOT / 'output'))
         
         # Ensure output directory exists
@@ -49,9 +182,6 @@ class AgentService:
         Returns:
             dict with papers, ideas, report_sections, report_formats
         """
-        from research.models import ResearchTask, ErrorLog
-        import gc
-        
         params = task.input_params
         query = params.get('query', '')
         mode = params.get('mode', 'Deep Research')
@@ -59,148 +189,241 @@ class AgentService:
         llm_provider = 'groq'  # Force Groq only for memory efficiency
         
         logger.info(f"[LIGHTWEIGHT] Starting task {self.task_id}: {query[:50]}")
-        task.mark_running()
+        if not task.mark_running():
+            logger.info(f"Task {self.task_id} is no longer pending, skipping")
+            return {}
+        
+        self._progress_writer = ProgressWriter(task)
+        self._progress_writer.start()
         
         try:
-            # Phase 1: Paper Search (0-50%)
-            self._update_progress(task, 10, "Searching papers...")
-            
-            from agent.lit_review import LiteratureReviewer
-            reviewer = LiteratureReviewer(llm_provider=llm_provider)
-            
-            if not reviewer.llm.available:
-                raise RuntimeError(f"Groq API not available. Check GROQ_API_KEY.")
-            
-            # Search papers
-            if mode == "Web Search":
-                papers = reviewer.web_search(query, num_results=5)
-            else:
-                search_query = query
-                if year_filter and year_filter > 0:
-                    search_query = f'({query}) AND submittedDate:[{year_filter}01010000 TO {year_filter}12312359]'
-                papers = reviewer.search(search_query, max_results=5, timeout=20)
-            
-            self._update_progress(task, 50, f"Found {len(papers)} papers")
-            
-            # Clear reviewer
-            del reviewer
-            gc.collect()
-            
-            # Phase 2: Generate Ideas (50-80%)
-            self._update_progress(task, 60, "Generating ideas...")
-            
-            from agent.hypothesis import HypothesisGenerator
-            hypo_gen = HypothesisGenerator(llm_provider=llm_provider)
-            
-            # Generate ideas using ONLY Groq (skip Oxlo)
-            ideas = hypo_gen.generate_ideas_groq_only(papers, max_ideas=5)
-            
-            self._update_progress(task, 80, f"Generated {len(ideas)} ideas")
-            
-            # Phase 3: Create Report (80-100%)
-            self._update_progress(task, 90, "Creating report...")
-            
-            # Generate simple report sections
-            report_sections = {
-                "introduction": self._generate_intro(query, papers, hypo_gen),
-                "the_issue": self._generate_issue(query, hypo_gen),
-                "conclusion": self._generate_conclusion(query, ideas, hypo_gen)
-            }
-            
-            # Clear generator
-            del hypo_gen
-            gc.collect()
-            
-            # Save report
-            from agent.report import ReportGenerator
-            reporter = ReportGenerator(out_dir=self.output_dir)
-            report_path = reporter.generate_simple_report(query, papers, ideas, report_sections)
-            
-            output_data = {
-                'papers': papers,
-                'ideas': ideas,
-                'report_sections': report_sections,
-                'report_formats': self._get_report_formats(report_path),
-            }
-            
-            del reporter
-            gc.collect()
+            key = _single_flight_key(query, mode, year_filter, llm_provider)
+            output_data = self._run_single_flight(
+                task, key, lambda: self._run_pipeline(task, query, mode, year_filter, llm_provider)
+            )
             
-            task.mark_completed(output_data)
+            # Flush progress first so a late write can't follow the final state
+            self._stop_progress_writer()
+            if not task.mark_completed(output_data):
+                raise TaskCancelled()
             self._update_progress(task, 100, "Complete!")
             
             logger.info(f"[LIGHTWEIGHT] Task {self.task_id} completed successfully")
             return output_data
             
+        except TaskCancelled:
+            logger.info(f"Task {self.task_id} was cancelled, stopping")
+            return {}
+        
         except Exception as e:
             error_msg = str(e)
-            error_traceback = traceback.format_exc()
+            error_traceback = traceback.format_exc()[-MAX_TRACEBACK_CHARS:]
             
             logger.error(f"Task {self.task_id} failed: {error_msg}", exc_info=True)
+            self._stop_progress_writer()
             
-            # Log error to database
-            ErrorLog.objects.create(
-                source=ErrorLog.Source.BACKEND,
-                error_code='AGENT_EXECUTION_ERROR',
-                message=error_msg,
-                context={'task_id': self.task_id, 'query': query[:100]},
-                stack_trace=error_traceback,
-                task=task
-            )
-            
-            # Mark task as failed
-            task.mark_failed(
-                error_code='AGENT_EXECUTION_ERROR',
-                error_message=error_msg,
-                traceback=error_traceback
-            )
+            # Mark the task failed and log the error in one transaction
+            with transaction.atomic():
+                failed = task.mark_failed(
+                    error_code='AGENT_EXECUTION_ERROR',
+                    error_message=error_msg,
+                    traceback=error_traceback
+                )
+                if failed:
+                    ErrorLog.objects.create(
+                        source=ErrorLog.Source.BACKEND,
+                        error_code='AGENT_EXECUTION_ERROR',
+                        message=error_msg,
+                        context={'task_id': self.task_id, 'query': query[:100]},
+                        stack_trace=error_traceback,
+                        task=task
+                    )
             
+            if not failed:
+                # Cancelled while running; the error is moot
+                logger.info(f"Task {self.task_id} was cancelled, ignoring its error")
+                return {}
             raise
+        
+        finally:
+            self._stop_progress_writer()
+    
+    def _search_arxiv(self, reviewer, search_query: str, max_results: int, timeout: int) -> list:
+        """arXiv search that serves repeated queries from CachedArxivQuery."""
+        max_age = timedelta(hours=getattr(settings, 'ARXIV_CACHE_HOURS', 24))
+        papers = CachedArxivQuery.lookup(search_query, max_results, max_age) if max_age else None
+        
+        if papers is not None:
+            logger.info(f"Task {self.task_id}: {len(papers)} papers from arXiv cache")
+        else:
+            papers = reviewer.fetch_arxiv(search_query, max_results=max_results, timeout=timeout)
+            # Short results may be a timeout or transient failure; don't pin them
+            if max_age and len(papers) == max_results:
+                CachedArxivQuery.store(search_query, max_results, papers)
+        
+        return reviewer.enrich_papers(papers)
+    
+    def _raise_if_cancelled(self, task):
+        """Stop the pipeline between phases if the task was cancelled."""
+        if task.is_cancelled():
+            raise TaskCancelled()
+    
+    def _stop_progress_writer(self):
+        if self._progress_writer is not None:
+            self._progress_writer.close()
+            self._progress_writer = None
     
     def _update_progress(self, task, progress: int, step: str):
-        """Update task progress in database."""
-        task.update_progress(progress, step)
+        """Publish progress to streams now; write it to the database in the background."""
+        publish_task_progress(task.pk, progress, step)
+        if self._progress_writer is not None:
+            self._progress_writer.submit(progress, step)
+        else:
+            task.update_progress(progress, step)
         
+        # Callbacks always see every update; only the DB write is coalesced
         if self.on_progress:
             self.on_progress(step, progress)
         
-        logger.debug(f"Task {self.task_id}: {progress}% - {step}")
+        logger.debug("Task %s: %d%% - %s", self.task_id, progress, step)
     
-    def _generate_intro(self, query, papers, hypo_gen):
-        """Generate introduction using Groq."""
-        try:
-            prompt = f"Write a brief introduction for a research report on: {query}. Mention that {len(papers)} papers were analyzed."
-            return hypo_gen.llm.generate(prompt, max_tokens=300)
-        except:
-            return f"This report analyzes {len(papers)} recent papers on {query}."
+    def _run_pipeline(self, task, query: str, mode: str, year_filter, llm_provider: str) -> dict:
+        """Search, generate ideas and write the report; returns the task output."""
+        # Phase 1: Paper Search (0-50%)
+        self._update_progress(task, 10, "Searching papers...")
+        
+        reviewer, hypo_gen = _get_agents(llm_provider)
+        if not reviewer.llm.available:
+            # Don't keep unusable agents cached; a later task retries once the key is set
+            _get_agents.cache_clear()
+            raise RuntimeError(f"Groq API not available. Check GROQ_API_KEY.")
+        
+        # Search papers
+        if mode == "Web Search":
+            papers = reviewer.web_search(query, num_results=5)
+        else:
+            search_query = query
+            if year_filter and year_filter > 0:
+                search_query = f'({query}) AND {_year_clause(year_filter)}'
+            papers = self._search_arxiv(reviewer, search_query, max_results=5, timeout=20)
+        
+        self._update_progress(task, 50, f"Found {len(papers)} papers")
+        self._raise_if_cancelled(task)
+        
+        # Phase 2: Generate Ideas (50-80%)
+        self._update_progress(task, 60, "Generating ideas...")
+        
+        # Generate ideas using ONLY Groq (skip Oxlo)
+        ideas = hypo_gen.generate_ideas_groq_only(papers, max_ideas=5)
+        
+        self._update_progress(task, 80, f"Generated {len(ideas)} ideas")
+        self._raise_if_cancelled(task)
+        
+        # Phase 3: Create Report (80-100%)
+        self._update_progress(task, 90, "Creating report...")
+        
+        # Generate all report sections in one LLM round-trip
+        report_sections = self._generate_sections(query, papers, ideas, hypo_gen)
+        
+        # Save report
+        report_path = _get_reporter(self.output_dir).generate_simple_report(query, papers, ideas, report_sections)
+        
+        output_data = {
+            'papers': papers,
+            'ideas': ideas,
+            'report_sections': report_sections,
+            'report_formats': self._get_report_formats(report_path),
+        }
+        return output_data
     
-    def _generate_issue(self, query, hypo_gen):
-        """Generate issue section using Groq."""
+    def _run_single_flight(self, task, key: str, run: Callable[[], dict]) -> dict:
+        """
+        Run the pipeline unless an identical one is already running here.
+        
+        Followers wait for the leader and reuse its output. If the leader
+        fails or takes too long, they run the pipeline themselves.
+        """
+        with _inflight_lock:
+            leader = _inflight.get(key)
+            if leader is None:
+                future = _inflight[key] = Future()
+        
+        if leader is not None:
+            self._update_progress(task, 10, "Waiting for an identical search in progress...")
+            try:
+                output_data = copy.deepcopy(leader.result(timeout=SINGLE_FLIGHT_WAIT))
+                logger.info(f"Task {self.task_id}: reused output of an identical in-flight run")
+                return output_data
+            except Exception as e:
+                logger.info(f"Task {self.task_id}: identical run unavailable ({type(e).__name__}), running independently")
+                return run()
+        
         try:
-            prompt = f"Describe the main research challenge or issue in the field of: {query}"
-            return hypo_gen.llm.generate(prompt, max_tokens=300)
-        except:
-            return f"The field of {query} faces several challenges that require further investigation."
+            output_data = run()
+            future.set_result(output_data)
+            return output_data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
     
-    def _generate_conclusion(self, query, ideas, hypo_gen):
-        """Generate conclusion using Groq."""
+    def _generate_sections(self, query, papers, ideas, hypo_gen) -> dict:
+        """Generate introduction, issue and conclusion with a single Groq call."""
+        fallback = {
+            "introduction": f"This report analyzes {len(papers)} recent papers on {query}.",
+            "the_issue": f"The field of {query} faces several challenges that require further investigation.",
+            "conclusion": f"This analysis of {query} has identified {len(ideas)} promising research directions for future work.",
+        }
+        
+        titles = "\n".join(f"- {p.get('title', 'Untitled')}" for p in papers[:5])
+        idea_titles = "\n".join(f"- {i.get('title', 'Untitled')}" for i in ideas[:5])
+        prompt = (
+            f"Write three short sections for a research report on: {query}\n\n"
+            f"Papers analyzed ({len(papers)}):\n{titles}\n\n"
+            f"New research ideas ({len(ideas)}):\n{idea_titles}\n\n"
+            "Return ONLY a JSON object with these keys:\n"
+            '{"introduction": "brief introduction mentioning the papers analyzed", '
+            '"the_issue": "the main research challenge in this field", '
+            '"conclusion": "conclusion referring to the new research ideas"}'
+        )
+        
         try:
-            prompt = f"Write a conclusion for a research report on {query}. We generated {len(ideas)} new research ideas."
-            return hypo_gen.llm.generate(prompt, max_tokens=300)
-        except:
-            return f"This analysis of {query} has identified {len(ideas)} promising research directions for future work."
+            response = hypo_gen.llm.generate_fast(prompt, max_tokens=900, timeout=30)
+            data = json.loads(clean_json_string(response)) if response else None
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Task {self.task_id}: report sections JSON invalid ({e}), using fallback")
+            return fallback
+        except Exception as e:
+            logger.warning(f"Task {self.task_id}: report section generation failed ({e}), using fallback")
+            return fallback
+        
+        if not isinstance(data, dict):
+            return fallback
+        return {
+            key: data[key].strip() if isinstance(data.get(key), str) and data[key].strip() else text
+            for key, text in fallback.items()
+        }
     
     def _get_report_formats(self, report_md_path: str) -> dict:
         """Get paths to all generated report formats."""
         if not report_md_path:
             return {}
         
-        base_path = report_md_path.rsplit('.', 1)[0]
+        # One directory read instead of a stat per format
+        report_dir, md_name = os.path.split(report_md_path)
+        stem = Path(md_name).stem
+        labels = {f"{stem}{ext}": label for ext, label in REPORT_FORMATS}
         formats = {}
+        try:
+            with os.scandir(report_dir or '.') as entries:
+                for entry in entries:
+                    label = labels.get(entry.name)
+                    if label and entry.is_file():
+                        formats[label] = entry.path
+        except OSError as e:
+            logger.warning(f"Task {self.task_id}: could not list report directory: {e}")
         
-        for ext, label in [('.md', 'markdown'), ('.docx', 'word'), ('.txt', 'text'), ('.json', 'json')]:
-            path = f"{base_path}{ext}"
-            if os.path.exists(path):
-                formats[label] = path
-        
-        return formats
+        # Keep the REPORT_FORMATS order
+        return {label: formats[label] for _, label in REPORT_FORMATS if label in formats}
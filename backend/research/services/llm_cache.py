@@ -0,0 +1,85 @@
+"""
+Response cache for LLM provider calls.
+
+Identical prompts recur across tasks (the same query returns the same arXiv
+papers, so enrichment, idea and report prompts repeat). Successful responses
+are stored in Django's cache (Redis in production, per-process memory
+otherwise), keyed on provider, model, token budget and the normalized prompt.
+Empty responses and provider errors are never cached, so fallbacks stay
+transient, and neither are hedged calls that finish after another provider
+already answered.
+"""
+import hashlib
+import json
+import logging
+from django.conf import settings
+from django.core.cache import cache
+
+from agent.llm import MultiLLMClient, hedge_lost
+from config import GROQ_MODEL, GEMINI_MODEL, OXLO_MODEL
+
+logger = logging.getLogger(__name__)
+
+HITS_KEY = 'llm_cache:hits'
+MISSES_KEY = 'llm_cache:misses'
+
+
+def llm_cache_key(provider: str, model: str, prompt: str, max_tokens: int) -> str:
+    """Stable key for a provider call; whitespace in the prompt is normalized."""
+    payload = json.dumps({
+        'provider': provider,
+        'model': model,
+        'max_tokens': max_tokens,
+        'prompt': ' '.join(prompt.split()),
+    }, sort_keys=True)
+    return 'llm_cache:' + hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _count(key: str):
+    try:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+def llm_cache_stats() -> dict:
+    """Hit/miss counters (per process unless the cache is shared)."""
+    return {'hits': cache.get(HITS_KEY, 0), 'misses': cache.get(MISSES_KEY, 0)}
+
+
+class CachedLLMClient(MultiLLMClient):
+    """MultiLLMClient whose provider calls go through the Django cache."""
+
+    def __init__(self):
+        super().__init__()
+        self.hedge_delay = getattr(settings, 'LLM_HEDGE_DELAY', self.hedge_delay)
+
+    def _cached(self, provider: str, model: str, call, prompt: str, max_tokens: int, timeout: int) -> str:
+        ttl = getattr(settings, 'LLM_CACHE_TTL', 3600)
+        if ttl <= 0:
+            return call(prompt, max_tokens, timeout)
+
+        key = llm_cache_key(provider, model, prompt, max_tokens)
+        cached = cache.get(key)
+        if cached is not None:
+            _count(HITS_KEY)
+            logger.debug("[LLM cache] %s hit", provider)
+            return cached
+
+        _count(MISSES_KEY)
+        response = call(prompt, max_tokens, timeout)
+        if hedge_lost():
+            logger.debug("[LLM cache] %s lost the hedge, not caching", provider)
+        elif response and response.strip():
+            cache.set(key, response, ttl)
+        return response
+
+    def _call_groq(self, prompt: str, max_tokens: int, timeout: int) -> str:
+        return self._cached('groq', GROQ_MODEL, super()._call_groq, prompt, max_tokens, timeout)
+
+    def _call_gemini(self, prompt: str, max_tokens: int, timeout: int) -> str:
+        return self._cached('gemini', GEMINI_MODEL, super()._call_gemini, prompt, max_tokens, timeout)
+
+    def _call_oxlo(self, prompt: str, max_tokens: int, timeout: int) -> str:
+        return self._cached('oxlo', OXLO_MODEL, super()._call_oxlo, prompt, max_tokens, timeout)
@@ -0,0 +1,23 @@
+"""
+Signal handlers keeping cached research responses fresh.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_task_caches
+from .models import ResearchTask
+
+# Saves touching only these fields don't affect the list or stats responses
+_PROGRESS_FIELDS = frozenset({'progress', 'current_step', 'updated_at'})
+
+
+@receiver(post_save, sender=ResearchTask)
+def task_saved(sender, instance, created, update_fields=None, **kwargs):
+    if not created and update_fields and _PROGRESS_FIELDS.issuperset(update_fields):
+        return
+    invalidate_task_caches()
+
+
+@receiver(post_delete, sender=ResearchTask)
+def task_deleted(sender, instance, **kwargs):
+    invalidate_task_caches()
@@ -0,0 +1,118 @@
+"""
+Background execution of research tasks.
+
+Tasks run on a Celery worker when Celery is installed and CELERY_BROKER_URL
+is configured. Otherwise they run on a background thread in the web process, so
+the submit request still returns immediately on a single-service deploy.
+"""
+import logging
+import threading
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+try:
+    from celery import shared_task
+    HAS_CELERY = True
+except ImportError:
+    HAS_CELERY = False
+
+logger = logging.getLogger(__name__)
+
+
+def execute_research_task(task_id: str):
+    """Run the research pipeline for a task and record any failure on it."""
+    from research.models import ResearchTask
+
+    try:
+        task = ResearchTask.objects.get(id=task_id)
+    except ResearchTask.DoesNotExist:
+        logger.error(f"Task {task_id} no longer exists, skipping execution")
+        return
+
+    if task.status != ResearchTask.Status.PENDING:
+        # Cancelled (or redelivered) before a worker picked it up
+        logger.info(f"Task {task_id} is {task.status}, skipping execution")
+        return
+
+    try:
+        # Imported here so a broken agent dependency fails the task, not the worker
+        from research.services import AgentService
+        AgentService(task_id=task_id).execute(task)
+    except Exception as e:
+        logger.error(f"Task {task_id} failed during execution: {e}", exc_info=True)
+        # No-op if the service already marked it failed or it was cancelled
+        task.mark_failed(
+            error_code='EXECUTION_ERROR',
+            error_message=str(e)
+        )
+
+
+if HAS_CELERY:
+    run_research_task = shared_task(
+        name='research.run_research_task',
+        acks_late=True,
+        ignore_result=True,
+    )(execute_research_task)
+
+
+def _run_in_thread(task_id: str):
+    try:
+        execute_research_task(task_id)
+    finally:
+        # Threads get their own DB connection; don't leave it open
+        connection.close()
+
+
+def fail_stale_tasks(max_age: int = None) -> int:
+    """
+    Mark RUNNING tasks whose worker went away as FAILED.
+    
+    A task whose process was killed or recycled mid-run would otherwise stay
+    RUNNING forever. Live tasks write progress well within STALE_TASK_TIMEOUT
+    (the default ``max_age``, in seconds). Returns the number marked failed.
+    """
+    from research.models import ResearchTask
+    
+    if max_age is None:
+        max_age = getattr(settings, 'STALE_TASK_TIMEOUT', 900)
+    cutoff = timezone.now() - timedelta(seconds=max_age)
+    stale = ResearchTask.objects.filter(
+        status=ResearchTask.Status.RUNNING, updated_at__lt=cutoff
+    ).only('id', 'status')
+    failed = 0
+    for task in stale:
+        # Conditional, so a task that finishes meanwhile is left alone
+        if task.mark_failed(
+            error_code='TASK_ABANDONED',
+            error_message='The worker running this task stopped before it finished',
+        ):
+            failed += 1
+    if failed:
+        logger.warning(f"Marked {failed} abandoned task(s) as failed")
+    return failed
+
+
+def enqueue_research_task(task_id: str):
+    """Schedule a task for background execution and return immediately."""
+    try:
+        fail_stale_tasks()
+    except Exception as e:
+        logger.error(f"Stale task sweep failed: {e}", exc_info=True)
+    
+    if HAS_CELERY and getattr(settings, 'CELERY_BROKER_URL', ''):
+        run_research_task.delay(task_id)
+        logger.info(f"Task {task_id} queued on Celery")
+        return
+
+    thread = threading.Thread(
+        target=_run_in_thread,
+        args=(task_id,),
+        name=f"research-{task_id[:8]}",
+        # Non-daemon, so a graceful shutdown waits for the task; a killed
+        # worker's task is picked up by fail_stale_tasks()
+        daemon=False,
+    )
+    thread.start()
+    logger.info(f"Task {task_id} started on background thread")
@@ -0,0 +1,336 @@
+"""
+Tests for research task state transitions, the agent service and its caches.
+
+Run with: python manage.py test
+"""
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from research.models import CachedArxivQuery, ErrorLog, ResearchTask
+from research.services import AgentService
+
+
+def make_task(**params) -> ResearchTask:
+    return ResearchTask.objects.create(input_params={'query': 'graph neural networks', **params})
+
+
+class TaskTransitionTests(TransactionTestCase):
+    """Conditional status updates on ResearchTask."""
+
+    def test_mark_failed_does_not_overwrite_cancellation(self):
+        task = make_task()
+        self.assertTrue(task.mark_running())
+        self.assertTrue(task.mark_cancelled())
+
+        self.assertFalse(task.mark_failed(error_code='X', error_message='late error'))
+        task.refresh_from_db()
+        self.assertEqual(task.status, ResearchTask.Status.CANCELLED)
+        self.assertIsNone(task.error_data)
+
+    def test_mark_completed_refused_after_cancellation(self):
+        task = make_task()
+        task.mark_running()
+        task.mark_cancelled()
+
+        self.assertFalse(task.mark_completed({'papers': [], 'ideas': []}))
+        task.refresh_from_db()
+        self.assertEqual(task.status, ResearchTask.Status.CANCELLED)
+
+    def test_mark_running_only_from_pending(self):
+        task = make_task()
+        self.assertTrue(task.mark_running())
+        self.assertFalse(task.mark_running())
+
+
+class AgentServiceCancellationTests(TransactionTestCase):
+    """A task cancelled mid-run stays cancelled whatever the pipeline does next."""
+
+    def test_error_after_cancel_keeps_cancelled(self):
+        task = make_task()
+
+        def cancel_then_fail(*args):
+            ResearchTask.objects.get(pk=task.pk).mark_cancelled()
+            raise RuntimeError("arXiv timed out")
+
+        with mock.patch.object(AgentService, '_run_pipeline', side_effect=cancel_then_fail):
+            result = AgentService(task_id=str(task.id)).execute(task)
+
+        self.assertEqual(result, {})
+        task.refresh_from_db()
+        self.assertEqual(task.status, ResearchTask.Status.CANCELLED)
+        self.assertFalse(ErrorLog.objects.filter(task=task).exists())
+
+    def test_error_without_cancel_marks_failed(self):
+        task = make_task()
+
+        with mock.patch.object(AgentService, '_run_pipeline', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                AgentService(task_id=str(task.id)).execute(task)
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, ResearchTask.Status.FAILED)
+        self.assertEqual(task.error_data['message'], "boom")
+        self.assertTrue(ErrorLog.objects.filter(task=task).exists())
+
+
+class AgentCacheTests(TransactionTestCase):
+    """Per-process agent reuse."""
+
+    def test_unavailable_llm_is_not_cached(self):
+        from research.services import agent_service
+
+        agent_service._get_agents.cache_clear()
+        task = make_task()
+        with mock.patch.object(agent_service, 'CachedLLMClient') as client_cls:
+            client_cls.return_value.available = False
+            with self.assertRaises(RuntimeError):
+                AgentService(task_id=str(task.id))._run_pipeline(task, 'q', 'Deep Research', None, 'groq')
+
+        self.assertEqual(agent_service._get_agents.cache_info().currsize, 0)
+
+
+class HedgedGenerationTests(TransactionTestCase):
+    """Fast generation fan-out through the LLM response cache."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+
+    def test_losing_call_is_not_cached(self):
+        import threading
+        import time
+        from django.core.cache import cache
+        from agent.llm import MultiLLMClient
+        from config import GROQ_MODEL, OXLO_MODEL
+        from research.services.llm_cache import CachedLLMClient, llm_cache_key
+
+        groq_done = threading.Event()
+
+        def slow_groq(self, prompt, max_tokens, timeout):
+            time.sleep(0.3)
+            return "slow answer"
+
+        def fast_oxlo(self, prompt, max_tokens, timeout):
+            return "fast answer"
+
+        client = CachedLLMClient()
+        client.groq_available = client.oxlo_available = True
+        client.gemini_available = False
+        client.hedge_delay = 0.05
+
+        original_cached = CachedLLMClient._cached
+
+        def tracking_cached(self, provider, *args):
+            try:
+                return original_cached(self, provider, *args)
+            finally:
+                if provider == 'groq':
+                    groq_done.set()
+
+        with mock.patch.object(MultiLLMClient, '_call_groq', slow_groq), \
+                mock.patch.object(MultiLLMClient, '_call_oxlo', fast_oxlo), \
+                mock.patch.object(CachedLLMClient, '_cached', tracking_cached):
+            self.assertEqual(client.generate_fast("prompt", max_tokens=10), "fast answer")
+            self.assertTrue(groq_done.wait(2))
+
+        self.assertEqual(cache.get(llm_cache_key('oxlo', OXLO_MODEL, "prompt", 10)), "fast answer")
+        self.assertIsNone(cache.get(llm_cache_key('groq', GROQ_MODEL, "prompt", 10)))
+
+
+class SingleFlightTests(SimpleTestCase):
+    """Identical in-flight runs share one pipeline execution."""
+
+    def _start(self, service, run, results):
+        def target():
+            try:
+                results[service.task_id] = service._run_single_flight(None, 'key', run)
+            except RuntimeError as e:
+                results[service.task_id] = e
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        return thread
+
+    def _run_leader_and_follower(self, leader_run, follower_run):
+        from research.services import agent_service
+
+        follower_waiting = threading.Event()
+        leader = AgentService(task_id='leader')
+        follower = AgentService(task_id='follower')
+        follower._update_progress = lambda *args: follower_waiting.set()
+        results = {}
+
+        threads = [self._start(leader, leader_run, results)]
+        while 'key' not in agent_service._inflight:
+            threading.Event().wait(0.01)
+        threads.append(self._start(follower, follower_run, results))
+        self.assertTrue(follower_waiting.wait(5))
+        return threads, results
+
+    def test_follower_reuses_leader_output(self):
+        from research.services import agent_service
+
+        release = threading.Event()
+        calls = []
+
+        def run():
+            calls.append(1)
+            release.wait(5)
+            return {'papers': [{'title': 'A'}]}
+
+        threads, results = self._run_leader_and_follower(run, run)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results['follower'], results['leader'])
+        self.assertIsNot(results['follower'], results['leader'])
+        self.assertNotIn('key', agent_service._inflight)
+
+    def test_follower_runs_itself_when_leader_fails(self):
+        release = threading.Event()
+
+        def failing_run():
+            release.wait(5)
+            raise RuntimeError("leader failed")
+
+        threads, results = self._run_leader_and_follower(failing_run, lambda: {'papers': []})
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertIsInstance(results['leader'], RuntimeError)
+        self.assertEqual(results['follower'], {'papers': []})
+
+
+class LLMCacheTests(SimpleTestCase):
+    """Provider responses reused through the Django cache."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from research.services.llm_cache import CachedLLMClient
+
+        cache.clear()
+        self.client = CachedLLMClient()
+        self.responses = []
+
+    def _call_groq(self, prompt, max_tokens, timeout):
+        from agent.llm import MultiLLMClient
+
+        def fake_groq(client, prompt, max_tokens, timeout):
+            self.responses.append(prompt)
+            return self.reply
+
+        with mock.patch.object(MultiLLMClient, '_call_groq', fake_groq):
+            return self.client._call_groq(prompt, max_tokens, timeout)
+
+    def test_identical_prompt_is_served_from_cache(self):
+        self.reply = "answer"
+        self.assertEqual(self._call_groq("Summarize  this", 100, 10), "answer")
+        # Whitespace differences hit the same entry
+        self.assertEqual(self._call_groq("Summarize this", 100, 10), "answer")
+        self.assertEqual(len(self.responses), 1)
+
+    def test_token_budget_is_part_of_the_key(self):
+        self.reply = "answer"
+        self._call_groq("prompt", 100, 10)
+        self._call_groq("prompt", 200, 10)
+        self.assertEqual(len(self.responses), 2)
+
+    def test_empty_response_is_not_cached(self):
+        self.reply = ""
+        self._call_groq("prompt", 100, 10)
+        self.reply = "answer"
+        self.assertEqual(self._call_groq("prompt", 100, 10), "answer")
+        self.assertEqual(len(self.responses), 2)
+
+    @override_settings(LLM_CACHE_TTL=0)
+    def test_zero_ttl_disables_cache(self):
+        self.reply = "answer"
+        self._call_groq("prompt", 100, 10)
+        self._call_groq("prompt", 100, 10)
+        self.assertEqual(len(self.responses), 2)
+
+
+class ArxivCacheTests(TestCase):
+    """Raw arXiv results reused per search query."""
+
+    papers = [{'title': f'Paper {i}'} for i in range(5)]
+
+    def setUp(self):
+        self.reviewer = mock.Mock()
+        self.reviewer.enrich_papers.side_effect = lambda papers: papers
+        self.service = AgentService(task_id='arxiv-cache')
+
+    def test_lookup_respects_max_age(self):
+        CachedArxivQuery.store('q', 5, self.papers)
+        self.assertEqual(CachedArxivQuery.lookup('q', 5, timedelta(hours=1)), self.papers)
+        self.assertIsNone(CachedArxivQuery.lookup('q', 3, timedelta(hours=1)))
+
+        CachedArxivQuery.objects.update(fetched_at=timezone.now() - timedelta(hours=2))
+        self.assertIsNone(CachedArxivQuery.lookup('q', 5, timedelta(hours=1)))
+
+    def test_full_result_is_fetched_once(self):
+        self.reviewer.fetch_arxiv.return_value = list(self.papers)
+
+        self.service._search_arxiv(self.reviewer, 'q', max_results=5, timeout=1)
+        papers = self.service._search_arxiv(self.reviewer, 'q', max_results=5, timeout=1)
+
+        self.assertEqual(papers, self.papers)
+        self.assertEqual(self.reviewer.fetch_arxiv.call_count, 1)
+        # Enrichment still runs on a cache hit
+        self.assertEqual(self.reviewer.enrich_papers.call_count, 2)
+
+    def test_short_result_is_not_cached(self):
+        self.reviewer.fetch_arxiv.return_value = self.papers[:2]
+
+        self.service._search_arxiv(self.reviewer, 'q', max_results=5, timeout=1)
+        self.service._search_arxiv(self.reviewer, 'q', max_results=5, timeout=1)
+
+        self.assertEqual(self.reviewer.fetch_arxiv.call_count, 2)
+        self.assertFalse(CachedArxivQuery.objects.exists())
+
+    @override_settings(ARXIV_CACHE_HOURS=0)
+    def test_zero_hours_disables_cache(self):
+        self.reviewer.fetch_arxiv.return_value = list(self.papers)
+
+        self.service._search_arxiv(self.reviewer, 'q', max_results=5, timeout=1)
+
+        self.assertFalse(CachedArxivQuery.objects.exists())
+
+
+class StaleTaskTests(TestCase):
+    """Recovery of tasks orphaned by a dead worker."""
+
+    def test_only_stale_running_tasks_are_failed(self):
+        from research.tasks import fail_stale_tasks
+
+        stale, fresh, pending = make_task(), make_task(), make_task()
+        stale.mark_running()
+        fresh.mark_running()
+        ResearchTask.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(fail_stale_tasks(max_age=600), 1)
+        statuses = dict(ResearchTask.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses[stale.pk], ResearchTask.Status.FAILED)
+        self.assertEqual(statuses[fresh.pk], ResearchTask.Status.RUNNING)
+        self.assertEqual(statuses[pending.pk], ResearchTask.Status.PENDING)
+
+
+class ErrorLogQueueTests(TransactionTestCase):
+    """Batched ErrorLog writes."""
+
+    def test_bad_row_does_not_drop_the_batch(self):
+        from research.error_queue import _write
+
+        def log(code):
+            return ErrorLog(source=ErrorLog.Source.FRONTEND, error_code=code, message='m')
+
+        _write([log('A'), log(None), log('C')])
+
+        self.assertEqual(sorted(ErrorLog.objects.values_list('error_code', flat=True)), ['A', 'C'])
@@ -1 +1,9 @@
 """ScholarPulse Django project."""
+
+# Celery is optional: without it, research tasks run on a background thread
+try:
+    from .celery import app as celery_app
+except ImportError:
+    celery_app = None
+
+__all__ = ['celery_app']
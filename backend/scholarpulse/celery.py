@@ -0,0 +1,14 @@
+"""
+Celery application for ScholarPulse.
+
+Start a worker with:
+    celery -A scholarpulse worker --loglevel=info
+"""
+import os
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'scholarpulse.settings')
+
+app = Celery('scholarpulse')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -5,6 +5,7 @@ Configured for SQLite MVP with easy PostgreSQL migration path.
 """
 
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -51,8 +52,13 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.ClientIPMiddleware',
 ]
 
+# Proxy addresses allowed to set X-Forwarded-For (comma-separated). Empty trusts
+# any peer, which suits Render where requests always arrive via its proxy.
+TRUSTED_PROXIES = [ip.strip() for ip in os.environ.get('TRUSTED_PROXIES', '').split(',') if ip.strip()]
+
 ROOT_URLCONF = 'scholarpulse.urls'
 
 TEMPLATES = [
@@ -73,21 +79,79 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'scholarpulse.wsgi.application'
 
-# Database - SQLite for MVP (easy switch to PostgreSQL)
-# To switch to PostgreSQL, just change ENGINE and add HOST, PORT, USER, PASSWORD
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-        # PostgreSQL migration: uncomment below and comment above
-        # 'ENGINE': 'django.db.backends.postgresql',
-        # 'NAME': os.environ.get('DB_NAME', 'scholarpulse'),
-        # 'USER': os.environ.get('DB_USER', 'postgres'),
-        # 'PASSWORD': os.environ.get('DB_PASSWORD', ''),
-        # 'HOST': os.environ.get('DB_HOST', 'localhost'),
-        # 'PORT': os.environ.get('DB_PORT', '5432'),
+# Database - PostgreSQL when DB_HOST is set, otherwise SQLite for the MVP
+# PostgreSQL needs psycopg (see requirements.txt); concurrent tasks then write
+# without SQLite's database-wide lock
+DB_HOST = os.environ.get('DB_HOST', '')
+
+# Research tasks one process runs at once (Celery worker, see below)
+CELERY_WORKER_CONCURRENCY = int(os.environ.get('CELERY_WORKER_CONCURRENCY', '2'))
+# Request threads per web process (gunicorn --threads in render.yaml)
+WEB_THREADS = int(os.environ.get('WEB_THREADS', '1'))
+# Per process, each running task holds two connections (its own and its
+# ProgressWriter's), each request thread one (SSE streams included), and the
+# ErrorLog writer one: 2 * 2 + 1 + 1 = 6 with the defaults
+DB_POOL_MAX_SIZE = int(os.environ.get(
+    'DB_POOL_MAX_SIZE', str(2 * CELERY_WORKER_CONCURRENCY + WEB_THREADS + 1)
+))
+
+if DB_HOST:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'scholarpulse'),
+            'USER': os.environ.get('DB_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': DB_HOST,
+            'PORT': os.environ.get('DB_PORT', '5432'),
+        }
+    }
+    if find_spec('psycopg_pool'):
+        # Django's built-in psycopg pool; pooling replaces CONN_MAX_AGE,
+        # which must stay 0 when it is on
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS'] = {
+            'pool': {'min_size': 1, 'max_size': DB_POOL_MAX_SIZE},
+        }
+    else:
+        # Without psycopg[pool], fall back to persistent connections
+        DATABASES['default']['CONN_MAX_AGE'] = 60
+        DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                # Wait for the write lock instead of failing when the task,
+                # progress and error-log threads write at the same time
+                'timeout': 20,
+                # Take the write lock when a transaction starts, so two
+                # transactions can't deadlock upgrading from a read lock
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
+
+# The task list index INCLUDEs extra columns on PostgreSQL; SQLite just builds
+# a plain index and would otherwise warn on every migrate
+SILENCED_SYSTEM_CHECKS = ['models.W040']
+
+# Cache - Redis when REDIS_URL is set, otherwise per-process memory
+REDIS_URL = os.environ.get('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
     }
-}
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -106,7 +170,19 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Django 5.1 dropped STATICFILES_STORAGE, so the storage is set via STORAGES.
+# collectstatic writes hashed names plus .gz and, with brotli installed, .br
+# copies; WhiteNoise serves the smallest the client accepts and caches hashed
+# files forever
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -141,9 +217,34 @@ CORS_ALLOWED_ORIGIN_REGEXES = [
 ]
 CORS_ALLOW_CREDENTIALS = True
 
-# Async Task Configuration (for future Celery integration)
-# CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
-# CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
+# Async Task Configuration
+# With a broker URL (e.g. redis://localhost:6379/0) research tasks go to a Celery
+# worker; without one they run on a background thread in the web process.
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', '')
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_SOFT_TIME_LIMIT = int(os.environ.get('CELERY_TASK_SOFT_TIME_LIMIT', '300'))
+CELERY_TASK_TIME_LIMIT = int(os.environ.get('CELERY_TASK_TIME_LIMIT', '360'))
+# Seconds a RUNNING task may go without a progress write before it is treated
+# as orphaned (its worker died) and marked FAILED; above the hard time limit
+STALE_TASK_TIMEOUT = int(os.environ.get('STALE_TASK_TIMEOUT', '900'))
+# prefork is the pool that enforces the soft/hard time limits above. Each child
+# loads its own copy of the agents, so concurrency stays low for a 512 MB
+# instance. 'threads' shares one copy and suits more I/O-bound tasks, but then
+# nothing bounds a task's runtime.
+# CELERY_WORKER_CONCURRENCY is set with the database settings, which size the pool from it
+CELERY_WORKER_POOL = os.environ.get('CELERY_WORKER_POOL', 'prefork')
+
+# Seconds to reuse identical LLM responses across tasks (0 disables)
+LLM_CACHE_TTL = int(os.environ.get('LLM_CACHE_TTL', '3600'))
+
+# Seconds before fast generation also tries the next provider. Hedged calls
+# that lose still run to completion and count against API quotas; 0 disables
+# hedging, so the next provider is only tried after a failure.
+LLM_HEDGE_DELAY = float(os.environ.get('LLM_HEDGE_DELAY', '4.0'))
+
+# Hours to reuse arXiv results for an identical search query (0 disables)
+ARXIV_CACHE_HOURS = int(os.environ.get('ARXIV_CACHE_HOURS', '24'))
 
 # ScholarPulse Configuration
 SCHOLARPULSE_OUTPUT_DIR = os.environ.get('SCHOLARPULSE_OUTPUT_DIR', str(BASE_DIR.parent / 'output'))
@@ -3,16 +3,27 @@ ScholarPulse API Client for Streamlit Frontend.
 
 Provides retry-safe REST API calls with structured error handling.
 """
+import os
 import time
 import logging
+import threading
 import requests
+from collections import OrderedDict
 from typing import Optional, Dict, Any
+from urllib.parse import urlsplit
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+# Pages of 25 tasks fetched for the library view
+LIST_MAX_PAGES = 40
+
+# Status payloads kept for ETag revalidation (the client is shared by all sessions)
+STATUS_CACHE_SIZE = 256
+
+
 class TaskStatus(Enum):
     PENDING = 'PENDING'
     RUNNING = 'RUNNING'
@@ -21,6 +32,9 @@ class TaskStatus(Enum):
     CANCELLED = 'CANCELLED'
 
 
+TERMINAL_STATUSES = {TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, TaskStatus.CANCELLED.value}
+
+
 @dataclass
 class APIError:
     """Structured API error."""
@@ -42,7 +56,7 @@ class APIError:
                     details=err.get('details'),
                     retry_after=err.get('retry_after')
                 )
-        except:
+        except (ValueError, TypeError, AttributeError):
             pass
         return cls(
             code='HTTP_ERROR',
@@ -62,7 +76,6 @@ class ScholarPulseAPI:
     
     def __init__(self, base_url: Optional[str] = None):
         # Default to Render backend URL or environment variable
-        import os
         default_url = os.environ.get('SCHOLARPULSE_API_URL', 'https://scholarpulse-backend.onrender.com')
         self.base_url = (base_url or default_url).rstrip('/')
         self.session = requests.Session()
@@ -72,6 +85,9 @@ class ScholarPulseAPI:
         })
         self.max_retries = 3
         self.retry_delay = 1.5
+        # Last status payload per active task, revalidated with its ETag
+        self._status_cache: OrderedDict = OrderedDict()
+        self._status_cache_lock = threading.Lock()
     
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request with retry logic."""
@@ -122,7 +138,7 @@ class ScholarPulseAPI:
         try:
             response = self._request('GET', '/api/health/')
             return response.status_code == 200
-        except:
+        except APIException:
             return False
     
     def submit_research(
@@ -160,18 +176,36 @@ class ScholarPulseAPI:
         else:
             raise APIException(APIError.from_response(response))
     
-    def list_tasks(self) -> list:
+    def list_tasks(self, max_pages: int = LIST_MAX_PAGES) -> list:
         """
-        List all research tasks.
+        List research tasks, newest first.
+        
+        The backend pages results with a cursor (25 per page); each page's
+        `next` link is followed until the list ends or max_pages is reached.
         
         Returns:
             list of dicts with task metadata
         """
-        response = self._request('GET', '/api/research/list/')
-        if response.status_code == 200:
-            return response.json()
+        tasks = []
+        endpoint = '/api/research/list/'
+        for _ in range(max_pages):
+            response = self._request('GET', endpoint)
+            if response.status_code != 200:
+                raise APIException(APIError.from_response(response))
+            
+            data = response.json()
+            if isinstance(data, list):
+                # Unpaginated (older) backend
+                return data
+            
+            tasks.extend(data.get('results', []))
+            next_url = data.get('next')
+            if not next_url:
+                break
+            endpoint = f"/api/research/list/?{urlsplit(next_url).query}"
         else:
-            raise APIException(APIError.from_response(response))
+            logger.warning(f"Task list truncated at {max_pages} pages ({len(tasks)} tasks)")
+        return tasks
     
     def get_stats(self) -> dict:
         """
@@ -193,13 +227,31 @@ class ScholarPulseAPI:
         Returns:
             dict with status, progress, current_step, error
         """
-        response = self._request('GET', f'/api/research/status/{task_id}/')
+        with self._status_cache_lock:
+            cached = self._status_cache.get(task_id)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self._request('GET', f'/api/research/status/{task_id}/', headers=headers)
         
-        if response.status_code == 200:
-            return response.json()
+        if response.status_code == 304 and cached:
+            return cached[1]
+        elif response.status_code == 200:
+            data = response.json()
+            self._cache_status(task_id, response.headers.get('ETag'), data)
+            return data
         else:
             raise APIException(APIError.from_response(response))
     
+    def _cache_status(self, task_id: str, etag: Optional[str], data: Dict[str, Any]):
+        """Remember a status for revalidation; finished tasks aren't polled again."""
+        with self._status_cache_lock:
+            if not etag or data.get('status') in TERMINAL_STATUSES:
+                self._status_cache.pop(task_id, None)
+                return
+            self._status_cache[task_id] = (etag, data)
+            self._status_cache.move_to_end(task_id)
+            while len(self._status_cache) > STATUS_CACHE_SIZE:
+                self._status_cache.popitem(last=False)
+    
     def get_result(self, task_id: str) -> Dict[str, Any]:
         """
         Get the results of a completed research task.
@@ -237,7 +289,7 @@ class ScholarPulseAPI:
                 'context': context or {},
                 'stack_trace': stack_trace or '',
             })
-        except:
+        except APIException:
             # Don't fail on error logging
             logger.error(f"Failed to log error: {error_code} - {message}")
     
@@ -6,7 +6,54 @@ Modern, enterprise-grade paper and idea display cards.
 import streamlit as st
 import textwrap
 import re
-from typing import Dict, List, Optional
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from styles.theme import ACCENT_BY_THEME
+
+
+# Showcase papers for the idle dashboard. Defined here rather than in the app
+# script because Streamlit re-executes the script on every rerun, while
+# imported modules are only evaluated once per process.
+DEMO_PAPERS = (
+    MappingProxyType({"title": "Multi-Agent Systems for Scientific Discovery", "summary": "How LLM agents collaborate...", "authors": ("S. Kumar", "A. Patel"), "method": "Agentic Framework", "objective": "Automate discovery"}),
+    MappingProxyType({"title": "Neural Architecture Search via Evolution", "summary": "Optimizing models through...", "authors": ("R. Chen",), "method": "Evolutionary", "objective": "SOTA Performance"}),
+)
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]')
+
+# _sanitize runs for every field of every card, so its patterns are compiled once
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_DICT_LIKE_RE = re.compile(r'\{[^}]*\}')
+_LIST_LIKE_RE = re.compile(r'\[[^\]]*\]')
+# Leftmost match of any keyword == cutting at each keyword in turn
+_CODE_KEYWORD_RE = re.compile('|'.join(re.escape(k) for k in (
+    'def ', 'class ', 'import ', 'from ', 'return ', 'if ', 'else:', 'for ', 'while ',
+)))
+
+# Card thumbnails cycle through these gradients (no external images)
+_PAPER_THUMB_GRADIENTS = (
+    "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+    "linear-gradient(135deg, #f093fb 0%, #f5576c 100%)",
+    "linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)",
+    "linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)",
+    "linear-gradient(135deg, #fa709a 0%, #fee140 100%)",
+)
+_IDEA_THUMB_GRADIENTS = (
+    "135deg, #EC4899, #8B5CF6",
+    "135deg, #F59E0B, #EF4444",
+    "135deg, #10B981, #3B82F6",
+    "135deg, #8B5CF6, #EC4899",
+    "135deg, #6366F1, #8B5CF6",
+)
+
+# Idea complexity badge colors, shared by every idea card
+_COMPLEXITY_COLORS = MappingProxyType({
+    "Low": "#10B981",
+    "Medium": "#F59E0B",
+    "High": "#EF4444",
+})
 
 
 def _sanitize(text: str) -> str:
@@ -16,18 +63,17 @@ def _sanitize(text: str) -> str:
     s = str(text)
     
     # Remove code blocks and backticks
-    s = re.sub(r'```[\s\S]*?```', '', s)  # Remove code blocks
+    s = _CODE_BLOCK_RE.sub('', s)  # Remove code blocks
     s = s.replace("```", "").replace("`", "")
     
     # Remove common JSON/dict artifacts
-    s = re.sub(r'\{[^}]*\}', '', s)  # Remove dict-like structures
-    s = re.sub(r'\[[^\]]*\]', '', s)  # Remove list-like structures
+    s = _DICT_LIKE_RE.sub('', s)  # Remove dict-like structures
+    s = _LIST_LIKE_RE.sub('', s)  # Remove list-like structures
     
     # Remove common programming keywords that might appear
-    programming_keywords = ['def ', 'class ', 'import ', 'from ', 'return ', 'if ', 'else:', 'for ', 'while ']
-    for keyword in programming_keywords:
-        if keyword in s:
-            s = s.split(keyword)[0]  # Take only text before code
+    match = _CODE_KEYWORD_RE.search(s)
+    if match:
+        s = s[:match.start()]  # Take only text before code
     
     # Escape HTML
     s = s.replace("<", "&lt;").replace(">", "&gt;")
@@ -49,7 +95,12 @@ def render_paper_card(paper: Dict, theme: str = "Dark", index: int = 0):
     Render an enhanced paper result card with ChatGPT/Gemini-style visual hierarchy.
     Includes paper thumbnail, better sections, and smooth interactions.
     """
-    accent = "#8B5CF6" if theme == "Dark" else "#6366F1" if theme == "Night" else "#7C3AED"
+    st.markdown(paper_card_html(paper, theme, index), unsafe_allow_html=True)
+
+
+def paper_card_html(paper: Mapping, theme: str = "Dark", index: int = 0) -> str:
+    """Build the HTML for a single paper card without emitting it."""
+    accent = ACCENT_BY_THEME.get(theme, ACCENT_BY_THEME["Light"])
     text_color = "#F1F5F9" if theme != "Light" else "#18181B"
     muted = "#94A3B8" if theme != "Light" else "#52525B"
     border = f"{accent}20"
@@ -57,10 +108,11 @@ def render_paper_card(paper: Dict, theme: str = "Dark", index: int = 0):
     
     title = _sanitize(paper.get('title', 'Untitled'))
     summary = _sanitize(paper.get('summary', 'No summary available.'))
-    authors = [_sanitize(a) for a in paper.get('authors', [])]
-    author_str = ", ".join(authors[:2]) if len(authors) > 1 else (authors[0] if authors else "Unknown")
-    if len(authors) > 2:
-        author_str += f" +{len(authors) - 2} more"
+    # Only the first two authors are shown, so only those are sanitized
+    raw_authors = paper.get('authors', [])
+    author_str = ", ".join(_sanitize(a) for a in raw_authors[:2]) or "Unknown"
+    if len(raw_authors) > 2:
+        author_str += f" +{len(raw_authors) - 2} more"
     
     year = paper.get('year', '2024')
     source = _sanitize(paper.get('source', 'arXiv'))
@@ -73,18 +125,11 @@ def render_paper_card(paper: Dict, theme: str = "Dark", index: int = 0):
     results = _sanitize(paper.get('results', 'N/A'))
     
     # Generate paper thumbnail - use a solid gradient instead of external images
-    gradient_colors = [
-        "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
-        "linear-gradient(135deg, #f093fb 0%, #f5576c 100%)",
-        "linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)",
-        "linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)",
-        "linear-gradient(135deg, #fa709a 0%, #fee140 100%)"
-    ]
-    thumbnail_gradient = gradient_colors[index % len(gradient_colors)]
+    thumbnail_gradient = _PAPER_THUMB_GRADIENTS[index % len(_PAPER_THUMB_GRADIENTS)]
     
     # Extract key insights
-    sentences = [s.strip() for s in re.split(r'[.!?]', summary) if len(s.strip()) > 15]
-    insights = sentences[:2]
+    sentences = (s.strip() for s in _SENTENCE_SPLIT_RE.split(summary))
+    insights = list(islice((s for s in sentences if len(s) > 15), 2))
     
     # Build metadata badges
     metadata_badges = f"""
@@ -142,10 +187,10 @@ def render_paper_card(paper: Dict, theme: str = "Dark", index: int = 0):
     
     # Main card HTML
     html = f"""
-<div class="premium-card" style="animation-delay: {index * 0.1}s; overflow: hidden; transition: transform 0.3s ease, box-shadow 0.3s ease;">
+<div class="premium-card" style="animation-delay: {index * 0.1}s; overflow: hidden; transition: transform 0.2s ease;">
     <div style="width: 100%; height: 180px; background: {thumbnail_gradient}; border-radius: 12px; margin-bottom: 16px; position: relative; display: flex; align-items: center; justify-content: center;">
         <div style="font-size: 4rem; opacity: 0.3;">📄</div>
-        <div style="position: absolute; top: 12px; right: 12px; background: rgba(0,0,0,0.7); backdrop-filter: blur(10px); padding: 6px 12px; border-radius: 20px; font-size: 0.7rem; font-weight: 800; color: white; text-transform: uppercase;">
+        <div style="position: absolute; top: 12px; right: 12px; background: rgba(0,0,0,0.8); padding: 6px 12px; border-radius: 20px; font-size: 0.7rem; font-weight: 800; color: white; text-transform: uppercase;">
             {source}
         </div>
     </div>
@@ -166,7 +211,7 @@ def render_paper_card(paper: Dict, theme: str = "Dark", index: int = 0):
     </div>
 </div>
 """
-    st.markdown(html, unsafe_allow_html=True)
+    return html
 
 
 def render_idea_card(idea: Dict, theme: str = "Dark", index: int = 0):
@@ -174,6 +219,11 @@ def render_idea_card(idea: Dict, theme: str = "Dark", index: int = 0):
     Render an enhanced research idea card with ChatGPT/Gemini-style design.
     Includes gradient background, better sections, and visual appeal.
     """
+    st.markdown(idea_card_html(idea, theme, index), unsafe_allow_html=True)
+
+
+def idea_card_html(idea: Mapping, theme: str = "Dark", index: int = 0) -> str:
+    """Build the HTML for a single idea card without emitting it."""
     accent = "#EC4899"  # Pink for ideas
     text_color = "#F1F5F9" if theme != "Light" else "#18181B"
     muted = "#94A3B8" if theme != "Light" else "#52525B"
@@ -192,14 +242,7 @@ def render_idea_card(idea: Dict, theme: str = "Dark", index: int = 0):
         requirements = [str(r) for r in raw_requirements]
     
     # Generate idea thumbnail (gradient with icon)
-    gradient_colors = [
-        ("135deg, #EC4899, #8B5CF6"),
-        ("135deg, #F59E0B, #EF4444"),
-        ("135deg, #10B981, #3B82F6"),
-        ("135deg, #8B5CF6, #EC4899"),
-        ("135deg, #6366F1, #8B5CF6")
-    ]
-    gradient = gradient_colors[index % len(gradient_colors)]
+    gradient = _IDEA_THUMB_GRADIENTS[index % len(_IDEA_THUMB_GRADIENTS)]
     
     # Requirements badges
     req_badges = "".join([
@@ -208,18 +251,13 @@ def render_idea_card(idea: Dict, theme: str = "Dark", index: int = 0):
     ])
     
     # Complexity indicator
-    complexity_colors = {
-        "Low": "#10B981",
-        "Medium": "#F59E0B",
-        "High": "#EF4444"
-    }
-    complexity_color = complexity_colors.get(complexity, "#F59E0B")
+    complexity_color = _COMPLEXITY_COLORS.get(complexity, _COMPLEXITY_COLORS["Medium"])
     
     html = f"""
-<div class="premium-card" style="border-left: 4px solid {accent}; animation-delay: {index * 0.12}s; overflow: hidden; transition: transform 0.3s ease, box-shadow 0.3s ease; position: relative;">
+<div class="premium-card" style="border-left: 4px solid {accent}; animation-delay: {index * 0.12}s; overflow: hidden; transition: transform 0.2s ease; position: relative;">
     <div style="width: 100%; height: 120px; background: linear-gradient({gradient}); border-radius: 12px; margin-bottom: 16px; display: flex; align-items: center; justify-content: center; position: relative;">
         <div style="font-size: 3rem; opacity: 0.9;">💡</div>
-        <div style="position: absolute; top: 12px; right: 12px; background: rgba(0,0,0,0.7); backdrop-filter: blur(10px); padding: 6px 12px; border-radius: 20px; font-size: 0.7rem; font-weight: 800; color: white; text-transform: uppercase;">
+        <div style="position: absolute; top: 12px; right: 12px; background: rgba(0,0,0,0.8); padding: 6px 12px; border-radius: 20px; font-size: 0.7rem; font-weight: 800; color: white; text-transform: uppercase;">
             RESEARCH IDEA
         </div>
         <div style="position: absolute; bottom: 12px; left: 12px; background: {complexity_color}; color: white; padding: 4px 10px; border-radius: 16px; font-size: 0.7rem; font-weight: 800; text-transform: uppercase;">
@@ -251,10 +289,10 @@ def render_idea_card(idea: Dict, theme: str = "Dark", index: int = 0):
     </div>
 </div>
 """
-    st.markdown(html, unsafe_allow_html=True)
+    return html
 
 
-def render_papers_grid(papers: List[Dict], theme: str = "Dark"):
+def render_papers_grid(papers: Sequence[Mapping], theme: str = "Dark"):
     """Render papers in a 2-column grid with ChatGPT-style section header."""
     if not papers:
         st.info("No papers found for this query.")
@@ -281,10 +319,16 @@ def render_papers_grid(papers: List[Dict], theme: str = "Dark"):
 </div>
 """, unsafe_allow_html=True)
     
+    # One markdown call per column instead of one per card
     cols = st.columns(2)
-    for idx, paper in enumerate(papers):
-        with cols[idx % 2]:
-            render_paper_card(paper, theme, idx)
+    for col_idx, col in enumerate(cols):
+        column_html = "".join(
+            paper_card_html(papers[idx], theme, idx)
+            for idx in range(col_idx, len(papers), 2)
+        )
+        if column_html:
+            with col:
+                st.markdown(column_html, unsafe_allow_html=True)
 
 
 def render_ideas_list(ideas: List[Dict], theme: str = "Dark"):
@@ -314,5 +358,4 @@ def render_ideas_list(ideas: List[Dict], theme: str = "Dark"):
 </div>
 """, unsafe_allow_html=True)
     
-    for idx, idea in enumerate(ideas):
-        render_idea_card(idea, theme, idx)
+    st.markdown("".join(idea_card_html(idea, theme, idx) for idx, idea in enumerate(ideas)), unsafe_allow_html=True)
@@ -4,8 +4,10 @@ Feedback and Status Components for ScholarPulse UI.
 Modern, card-based feedback for success, warning, and error states.
 """
 import streamlit as st
-import textwrap
 import re
+from functools import lru_cache
+
+from styles.theme import ACCENT_BY_THEME, minify_css
 
 def _sanitize(text: str) -> str:
     """Sanitize raw agent text to prevent HTML breakage."""
@@ -15,8 +17,9 @@ def _sanitize(text: str) -> str:
     s = s.replace("<", "&lt;").replace(">", "&gt;")
     return s.strip()
 
+@lru_cache(maxsize=None)
 def get_feedback_styles(theme: str = "Dark") -> str:
-    """Get CSS for feedback components."""
+    """Get CSS for feedback components (memoized per theme, like get_theme_css)."""
     # Theme colors for icons and borders
     if theme == "Dark":
         success = "#10B981"
@@ -34,7 +37,7 @@ def get_feedback_styles(theme: str = "Dark") -> str:
         error = "#EF4444"
         info = "#3B82F6"
 
-    return textwrap.dedent(f"""
+    return minify_css(f"""
         <style>
             .feedback-card {{
                 padding: 16px 20px;
@@ -69,6 +72,17 @@ def get_feedback_styles(theme: str = "Dark") -> str:
                 opacity: 0.9 !important;
                 line-height: 1.5 !important;
             }}
+
+            /* Progress liveness runs in the browser between status polls */
+            @keyframes dotPulse {{
+                0%, 100% {{ opacity: 1; transform: scale(1); }}
+                50% {{ opacity: 0.35; transform: scale(0.7); }}
+            }}
+
+            .status-dot.pulsing {{
+                border-radius: 50%;
+                animation: dotPulse 1.4s ease-in-out infinite;
+            }}
         </style>
     """)
 
@@ -148,13 +162,13 @@ def render_connection_error():
 
 def render_progress_card(progress: int, step_text: str, theme: str = "Dark"):
     """Render a modern progress indicator with premium styling."""
-    accent = "#8B5CF6" if theme == "Dark" else "#6366F1" if theme == "Night" else "#7C3AED"
+    accent = ACCENT_BY_THEME.get(theme, ACCENT_BY_THEME["Light"])
     bg = "rgba(139, 92, 246, 0.1)"
     
     step_text = _sanitize(step_text)
     
     html = f"""
-<div class="premium-card" style="padding: 24px; margin-bottom: 24px; animation: fadeInUp 0.5s ease-out;">
+<div class="premium-card" style="padding: 24px; margin-bottom: 24px;">
 <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px;">
 <span style="font-weight: 700; font-size: 0.95rem; letter-spacing: 0.5px; color: {accent};">AGENT MISSION IN PROGRESS</span>
 <span style="font-weight: 800; font-size: 1rem; color: {accent};">{progress}%</span>
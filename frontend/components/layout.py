@@ -0,0 +1,49 @@
+"""
+Layout Components for ScholarPulse UI.
+
+Static chrome shared by every page: the top navbar and the sidebar branding.
+"""
+import streamlit as st
+from functools import lru_cache
+
+from styles.theme import get_color_scheme
+
+
+@lru_cache(maxsize=None)
+def _navbar_html(backend_healthy: bool) -> str:
+    status_class = "" if backend_healthy else "offline"
+    status_text = "Connected" if backend_healthy else "Disconnected"
+    return f"""
+<div class="top-navbar">
+<a class="top-navbar-brand gradient-text" href="#" style="font-size: 1.3rem;">ScholarPulse</a>
+<div class="navbar-status">
+<div class="status-dot {status_class}"></div>
+<span style="font-weight: 500;">Backend: {status_text}</span>
+</div>
+</div>
+"""
+
+
+@lru_cache(maxsize=None)
+def _branding_html(theme: str) -> str:
+    colors = get_color_scheme(theme)
+    return f"""
+<div class="sidebar-logo-container">
+<div style="width: 56px; height: 56px; border-radius: 16px; background: linear-gradient(135deg, #6366F1, #8B5CF6); display: flex; align-items: center; justify-content: center; font-size: 1.6rem; box-shadow: 0 8px 16px rgba(99, 102, 241, 0.3);">🧠</div>
+<div style="text-align: center;">
+<div style="font-weight: 700; font-size: 1.2rem; color: {colors['text']}; letter-spacing: -0.5px;">ScholarPulse</div>
+<div style="font-size: 0.75rem; color: {colors['muted']}; font-weight: 500; text-transform: uppercase; letter-spacing: 1px;">AI Research Agent</div>
+</div>
+</div>
+<br>
+"""
+
+
+def render_top_navbar(backend_healthy: bool):
+    """Render the top navbar. Only two variants exist, so both are built at most once."""
+    st.markdown(_navbar_html(bool(backend_healthy)), unsafe_allow_html=True)
+
+
+def render_sidebar_branding(theme: str = "Dark"):
+    """Render the sidebar logo block, built once per theme."""
+    st.markdown(_branding_html(theme), unsafe_allow_html=True)
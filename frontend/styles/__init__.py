@@ -1,4 +1,4 @@
 """Styles package for ScholarPulse UI."""
-from .theme import get_theme_css, get_color_scheme
+from .theme import ACCENT_BY_THEME, THEME_PALETTES, get_theme_css, get_color_scheme
 
-__all__ = ['get_theme_css', 'get_color_scheme']
+__all__ = ['ACCENT_BY_THEME', 'THEME_PALETTES', 'get_theme_css', 'get_color_scheme']
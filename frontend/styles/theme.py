@@ -3,52 +3,100 @@ Premium Theme CSS for ScholarPulse UI.
 
 Aurora Minimal Color Palette with advanced SaaS aesthetics and motion-enhanced interactions.
 """
-import textwrap
+import re
+from functools import lru_cache
 
 
+# Per-theme palettes; unknown theme names fall back to Light
+THEME_PALETTES = {
+    "Dark": {
+        "bg": "#0F0F23",
+        "card": "rgba(30, 30, 60, 0.92)",
+        "sidebar": "linear-gradient(180deg, #15152E 0%, #0F0F23 100%)",
+        "text": "#F1F5F9",
+        "muted": "#94A3B8",
+        "accent": "#8B5CF6",
+        "border": "rgba(139, 92, 246, 0.12)",
+        "shadow": "rgba(139, 92, 246, 0.2)",
+    },
+    "Night": {
+        "bg": "#09090B",
+        "card": "rgba(24, 24, 27, 0.92)",
+        "sidebar": "linear-gradient(180deg, #121214 0%, #09090B 100%)",
+        "text": "#FAFAFA",
+        "muted": "#71717A",
+        "accent": "#6366F1",
+        "border": "rgba(99, 102, 241, 0.12)",
+        "shadow": "rgba(99, 102, 241, 0.2)",
+    },
+    "Light": {
+        "bg": "#F8FAFC",
+        "card": "rgba(255, 255, 255, 0.92)",
+        "sidebar": "linear-gradient(180deg, #EFF6FF 0%, #F8FAFC 100%)",
+        "text": "#1E293B",
+        "muted": "#64748B",
+        "accent": "#7C3AED",
+        "border": "rgba(124, 58, 237, 0.08)",
+        "shadow": "rgba(124, 58, 237, 0.15)",
+    },
+}
+
+# Accent color per theme, shared by the component renderers
+ACCENT_BY_THEME = {name: palette["accent"] for name, palette in THEME_PALETTES.items()}
+
+_COLOR_SCHEME_KEYS = ("bg", "card", "text", "muted", "accent", "border")
+
+
+def _palette(theme: str) -> dict:
+    return THEME_PALETTES.get(theme, THEME_PALETTES["Light"])
+
+# Web fonts are requested via <link> tags rather than an @import inside the
+# inline <style>, which the browser can only discover after parsing the CSS.
+# Only the weights the UI actually uses are requested.
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Outfit:wght@400;500;600;700;800&family=Inter:wght@400;500;600;700&display=swap">'
+)
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace so less CSS is sent on each rerun."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_RE.sub(r"\1", css).strip()
+
+
+@lru_cache(maxsize=None)
 def get_theme_css(theme: str = "Dark") -> str:
-    """Get complete CSS for the selected premium theme with iPhone glassmorphism."""
+    """
+    Get complete CSS for the selected premium theme with iPhone glassmorphism.
+    
+    Memoized per theme: the stylesheet is static for a given theme, so each
+    variant is built once per process instead of on every Streamlit rerun.
+    """
     
     # Aurora Minimal Color Palette
     primary_gradient = "linear-gradient(135deg, #6366F1, #8B5CF6)"
     accent_pink = "#EC4899"
     accent_amber = "#F59E0B"
     
-    if theme == "Dark":
-        bg_color = "#0F0F23"
-        card_bg = "rgba(30, 30, 60, 0.4)"
-        card_hover_bg = "rgba(40, 40, 80, 0.6)"
-        sidebar_bg = "linear-gradient(180deg, #15152E 0%, #0F0F23 100%)"
-        text_primary = "#F1F5F9"
-        text_muted = "#94A3B8"
-        accent = "#8B5CF6"
-        border_color = "rgba(139, 92, 246, 0.12)"
-        shadow_accent = "rgba(139, 92, 246, 0.2)"
-    elif theme == "Night":
-        bg_color = "#09090B"
-        card_bg = "rgba(24, 24, 27, 0.6)"
-        card_hover_bg = "rgba(32, 32, 35, 0.8)"
-        sidebar_bg = "linear-gradient(180deg, #121214 0%, #09090B 100%)"
-        text_primary = "#FAFAFA"
-        text_muted = "#71717A"
-        accent = "#6366F1"
-        border_color = "rgba(99, 102, 241, 0.12)"
-        shadow_accent = "rgba(99, 102, 241, 0.2)"
-    else:  # Light
-        bg_color = "#F8FAFC"
-        card_bg = "rgba(255, 255, 255, 0.7)"
-        card_hover_bg = "rgba(255, 255, 255, 0.9)"
-        sidebar_bg = "linear-gradient(180deg, #EFF6FF 0%, #F8FAFC 100%)"
-        text_primary = "#1E293B"
-        text_muted = "#64748B"
-        accent = "#7C3AED"
-        border_color = "rgba(124, 58, 237, 0.08)"
-        shadow_accent = "rgba(124, 58, 237, 0.15)"
+    palette = _palette(theme)
+    bg_color = palette["bg"]
+    card_bg = palette["card"]
+    sidebar_bg = palette["sidebar"]
+    text_primary = palette["text"]
+    text_muted = palette["muted"]
+    accent = palette["accent"]
+    border_color = palette["border"]
+    shadow_accent = palette["shadow"]
     
-    return textwrap.dedent(f"""
+    return _FONT_LINKS + minify_css(f"""
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700;800&family=Inter:wght@300;400;500;600;700&display=swap');
-            
             /* Base Reset & Typography */
             .stApp {{ 
                 background: {bg_color};
@@ -65,12 +113,6 @@ def get_theme_css(theme: str = "Dark") -> str:
                 to {{ opacity: 1; transform: translateY(0); }}
             }}
             
-            @keyframes glowPulse {{
-                0% {{ box-shadow: 0 0 5px {shadow_accent}; }}
-                50% {{ box-shadow: 0 0 20px {shadow_accent}; }}
-                100% {{ box-shadow: 0 0 5px {shadow_accent}; }}
-            }}
-            
             @keyframes slideInSide {{
                 from {{ transform: translateX(-20px); opacity: 0; }}
                 to {{ transform: translateX(0); opacity: 1; }}
@@ -145,24 +187,16 @@ def get_theme_css(theme: str = "Dark") -> str:
                 border-radius: 0 4px 4px 0;
             }}
 
-            /* Premium Bento Cards */
+            /* Premium Bento Cards (opaque fill instead of backdrop blur to keep scroll/paint cheap) */
             .premium-card {{
                 background: {card_bg};
-                backdrop-filter: blur(12px);
-                -webkit-backdrop-filter: blur(12px);
                 border-radius: 20px;
                 border: 1px solid {border_color};
                 padding: 24px;
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+                transition: transform 0.2s ease;
+                will-change: transform;
                 animation: fadeInUp 0.6s ease-out forwards;
             }}
-            
-            .premium-card:hover {{
-                transform: translateY(-5px) scale(1.01);
-                background: {card_hover_bg};
-                border-color: {accent}40;
-                box-shadow: 0 20px 40px rgba(0,0,0,0.2), 0 0 15px {shadow_accent};
-            }}
 
             /* Modern Inputs & Focus States */
             .stTextInput>div>div>input {{
@@ -171,7 +205,7 @@ def get_theme_css(theme: str = "Dark") -> str:
                 border-radius: 14px !important;
                 color: {text_primary} !important;
                 padding: 12px 18px !important;
-                transition: all 0.3s ease !important;
+                transition: transform 0.2s ease !important;
                 box-shadow: inset 0 2px 4px rgba(0,0,0,0.05) !important;
             }}
             
@@ -189,7 +223,7 @@ def get_theme_css(theme: str = "Dark") -> str:
                 font-weight: 600 !important;
                 border-radius: 14px !important;
                 padding: 14px 28px !important;
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+                transition: transform 0.2s ease !important;
                 text-transform: none !important;
                 letter-spacing: 0.3px !important;
                 box-shadow: 0 4px 15px {shadow_accent} !important;
@@ -197,8 +231,6 @@ def get_theme_css(theme: str = "Dark") -> str:
             
             .stButton>button:hover {{
                 transform: translateY(-2px) !important;
-                box-shadow: 0 8px 25px {shadow_accent} !important;
-                filter: brightness(1.1);
             }}
             
             .stButton>button:active {{
@@ -213,11 +245,10 @@ def get_theme_css(theme: str = "Dark") -> str:
                 font-weight: 600;
                 text-transform: uppercase;
                 letter-spacing: 0.5px;
-                transition: all 0.2s ease;
+                transition: transform 0.2s ease;
             }}
             .premium-tag:hover {{
                 transform: scale(1.1);
-                filter: brightness(1.2);
             }}
 
             /* Elegant Scrollbar */
@@ -246,8 +277,7 @@ def get_theme_css(theme: str = "Dark") -> str:
             
             /* Navbar Stickiness & Glow */
             .top-navbar {{
-                background: {bg_color}cc !important;
-                backdrop-filter: blur(20px);
+                background: {bg_color}f2 !important;
                 box-shadow: 0 4px 30px rgba(0,0,0,0.1);
             }}
 
@@ -419,10 +449,9 @@ def get_theme_css(theme: str = "Dark") -> str:
                 font-size: 0.75rem;
                 font-weight: 500;
                 border: 1px solid {accent}25;
-                transition: all 0.2s ease;
+                transition: transform 0.2s ease;
             }}
             .insight-chip:hover {{
-                background: {accent}25;
                 transform: translateY(-1px);
             }}
 
@@ -435,14 +464,9 @@ def get_theme_css(theme: str = "Dark") -> str:
                 transition: max-height 0.4s cubic-bezier(0.4, 0, 0.2, 1);
             }}
             
-            /* Enhanced Premium Card Hover */
+            /* Premium Card Hover (transform only, stays on the compositor) */
             .premium-card:hover {{
                 transform: translateY(-8px) scale(1.015);
-                box-shadow: 0 25px 50px rgba(0,0,0,0.3), 0 0 20px {shadow_accent};
-                border-color: {accent}60;
-            }}
-            .premium-card:hover .insight-chip {{
-                border-color: {accent}50;
             }}
         </style>
     """)
@@ -450,30 +474,5 @@ def get_theme_css(theme: str = "Dark") -> str:
 
 def get_color_scheme(theme: str = "Dark") -> dict:
     """Get color scheme dict for the theme."""
-    if theme == "Dark":
-        return {
-            "bg": "#0F0F23",
-            "card": "rgba(30, 30, 60, 0.4)",
-            "text": "#F1F5F9",
-            "muted": "#94A3B8",
-            "accent": "#8B5CF6",
-            "border": "rgba(139, 92, 246, 0.12)",
-        }
-    elif theme == "Night":
-        return {
-            "bg": "#09090B",
-            "card": "rgba(24, 24, 27, 0.6)",
-            "text": "#FAFAFA",
-            "muted": "#71717A",
-            "accent": "#6366F1",
-            "border": "rgba(99, 102, 241, 0.12)",
-        }
-    else:
-        return {
-            "bg": "#F8FAFC",
-            "card": "rgba(255, 255, 255, 0.7)",
-            "text": "#1E293B",
-            "muted": "#64748B",
-            "accent": "#7C3AED",
-            "border": "rgba(124, 58, 237, 0.08)",
-        }
+    palette = _palette(theme)
+    return {key: palette[key] for key in _COLOR_SCHEME_KEYS}